@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import math
 
 import numpy as np
 
 
 def _rotation_matrix(angle: float) -> np.ndarray:
-    cos_a = float(np.cos(angle))
-    sin_a = float(np.sin(angle))
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
     return np.array([[cos_a, -sin_a], [sin_a, cos_a]], dtype=np.float64)
 
 
@@ -31,6 +32,19 @@ def _ensure_2xn(coords: np.ndarray, domain: str) -> np.ndarray:
     return np.asarray(arr, dtype=np.float64)
 
 
+def _ensure_nx2(points: np.ndarray, domain: str) -> np.ndarray:
+    """Validate and normalise point arrays to a C-contiguous (N, 2) layout."""
+
+    arr = np.asarray(points, dtype=np.float64)
+    if arr.ndim == 1:
+        if arr.size != 2:
+            raise ValueError(f"{domain} points must have size 2 along the last axis.")
+        arr = arr.reshape(1, 2)
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError(f"{domain} points must be provided as an (N, 2) array.")
+    return np.ascontiguousarray(arr)
+
+
 @dataclass(frozen=True)
 class DMDCalibration:
     """Bidirectional mappings between camera pixels, DMD mirrors and micrometres.
@@ -102,6 +116,23 @@ class DMDCalibration:
     def micrometre_to_camera(self, coords: np.ndarray) -> np.ndarray:
         return self.dmd_to_camera(self.micrometre_to_dmd(coords))
 
+    def camera_points_to_micrometre(self, points: np.ndarray) -> np.ndarray:
+        """Map (N, 2) camera pixel points to (N, 2) micrometre points."""
+
+        pts = _ensure_nx2(points, "Camera")
+        origin = np.asarray(self.camera_origin_pixels, dtype=np.float64)
+        inverse_basis = np.linalg.inv(self._camera_basis_matrix())
+        dmd = (pts - origin) @ inverse_basis.T
+        return dmd * np.asarray(self.micrometers_per_mirror, dtype=np.float64)
+
+    def micrometre_points_to_camera(self, points: np.ndarray) -> np.ndarray:
+        """Map (N, 2) micrometre points to (N, 2) camera pixel points."""
+
+        pts = _ensure_nx2(points, "Micrometre")
+        dmd = pts / np.asarray(self.micrometers_per_mirror, dtype=np.float64)
+        origin = np.asarray(self.camera_origin_pixels, dtype=np.float64)
+        return dmd @ self._camera_basis_matrix().T + origin
+
     def image_to_dmd(self, coords: np.ndarray) -> np.ndarray:
         return self.camera_to_dmd(self.image_to_camera(coords))
 
@@ -1,6 +1,8 @@
 """Geometry utilities for handling coordinate transformations and polygon masks."""
 
 from dataclasses import dataclass
+import math
+
 import numpy as np
 from skimage.draw import polygon2mask
 from .calibration import DMDCalibration
@@ -41,8 +43,8 @@ class PatternCoordinates:
         The matrix is a 3x3 affine transformation matrix.
         """
         d = self.field_size
-        cos_theta = np.cos(self.orientation)
-        sin_theta = np.sin(self.orientation)
+        cos_theta = math.cos(self.orientation)
+        sin_theta = math.sin(self.orientation)
         return np.array(
             [
                 [cos_theta / d, sin_theta / d, self.origin[0]],
@@ -89,6 +91,30 @@ class PatternCoordinates:
         return transformed_coords[:2]
 
 
+# Corner order of a centred rectangle: (-x, -y), (+x, -y), (+x, +y), (-x, +y).
+_RECTANGLE_CORNER_SIGNS = np.array(
+    [[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]], dtype=np.float64
+)
+
+
+def rectangle_corners(
+    centres: np.ndarray, width: float, height: float, angle_rad: float
+) -> np.ndarray:
+    """Return the corners of equally sized rectangles rotated by ``angle_rad``.
+
+    ``centres`` is an ``(N, 2)`` array giving ``(N, 4, 2)`` corners, or a single
+    ``(2,)`` point giving ``(4, 2)``. All corners come from one broadcast sum.
+    """
+
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    # Rows are the rectangle's width (u) and height (v) directions.
+    basis = np.array([[cos_a, sin_a], [-sin_a, cos_a]], dtype=np.float64)
+    offsets = (_RECTANGLE_CORNER_SIGNS * (0.5 * width, 0.5 * height)) @ basis
+    centres = np.asarray(centres, dtype=np.float64)
+    return centres[..., np.newaxis, :] + offsets
+
+
 def _camera_pixel_to_micrometre_scale(calibration: DMDCalibration) -> np.ndarray:
     """Return the micrometre length of one camera pixel along each axis."""
 
@@ -108,13 +134,11 @@ def axis_definition_components(
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Return origin, per-axis scales, and unit vectors in micrometres."""
 
-    origin_camera = np.asarray(axis.origin_camera, dtype=np.float64)
-    if origin_camera.shape != (2,):
-        origin_camera = origin_camera.reshape(2)
-    origin_um = calibration.camera_to_micrometre(origin_camera.reshape(2, 1)).T[0]
+    origin_camera = np.asarray(axis.origin_camera, dtype=np.float64).reshape(2)
+    origin_um = calibration.camera_points_to_micrometre(origin_camera[np.newaxis, :])[0]
 
-    cos_a = float(np.cos(axis.angle_rad))
-    sin_a = float(np.sin(axis.angle_rad))
+    cos_a = math.cos(axis.angle_rad)
+    sin_a = math.sin(axis.angle_rad)
     rotation = np.array(
         [[cos_a, -sin_a], [sin_a, cos_a]],
         dtype=np.float64,
@@ -36,6 +36,7 @@ class CalibrationPreferences:
     _KEY_GRID_ANGLE = "grid/angle"
     _KEY_GRID_ORIGIN_X = "grid/origin_x"
     _KEY_GRID_ORIGIN_Y = "grid/origin_y"
+    _KEY_GPU_DISPLAY = "display/use_gpu"
 
     def __init__(self) -> None:
         self._settings = QSettings(self._ORG, self._APP)
@@ -129,6 +130,13 @@ class CalibrationPreferences:
         self._settings.setValue(self._KEY_AXIS_BEHAVIOUR, mode)
         self._settings.sync()
 
+    def gpu_display_enabled(self) -> bool:
+        return self._to_bool(self._settings.value(self._KEY_GPU_DISPLAY), False)
+
+    def set_gpu_display_enabled(self, enabled: bool) -> None:
+        self._settings.setValue(self._KEY_GPU_DISPLAY, bool(enabled))
+        self._settings.sync()
+
     def grid_parameters(self) -> GridParameters:
         return GridParameters(
             rows=self._to_int(self._settings.value(self._KEY_GRID_ROWS), 2),
@@ -289,6 +289,10 @@ class PolygonDrawingCapture(QObject):
         self._scene = view_box.scene()
         self._loop: QEventLoop | None = None
         self._points: list[QPointF] = []
+        # Vertex coordinates mirrored as floats so mouse-move previews don't
+        # re-read every QPointF.
+        self._xs: list[float] = []
+        self._ys: list[float] = []
         self._preview: pg.PlotDataItem | None = None
         self._result: list[QPointF] | None = None
         self._original_mouse_enabled: tuple[bool, bool] = (True, True)
@@ -312,6 +316,8 @@ class PolygonDrawingCapture(QObject):
         self._cleanup_preview()
         points = self._result
         self._points.clear()
+        self._xs.clear()
+        self._ys.clear()
         self._result = None
         return points
 
@@ -351,6 +357,8 @@ class PolygonDrawingCapture(QObject):
     def _append_point(self, scene_pos: QPointF) -> None:
         view_point = self._view_box.mapSceneToView(scene_pos)
         self._points.append(view_point)
+        self._xs.append(view_point.x())
+        self._ys.append(view_point.y())
         self._update_preview(current=None)
 
     def _update_preview(self, current: QPointF | None) -> None:
@@ -365,14 +373,13 @@ class PolygonDrawingCapture(QObject):
             )
             self._preview.setZValue(10_000)
             self._view_box.addItem(self._preview)
-        xs = [pt.x() for pt in self._points]
-        ys = [pt.y() for pt in self._points]
+        xs, ys = self._xs, self._ys
         if current is not None:
-            xs.append(current.x())
-            ys.append(current.y())
-        elif len(self._points) >= 2:
-            xs.append(self._points[0].x())
-            ys.append(self._points[0].y())
+            xs = xs + [current.x()]
+            ys = ys + [current.y()]
+        elif len(xs) >= 2:
+            xs = xs + xs[:1]
+            ys = ys + ys[:1]
         self._preview.setData(xs, ys)
 
     def _finish(self, commit: bool) -> None:
@@ -1,14 +1,25 @@
 import os
-import glob
 import math
+import tempfile
 from pathlib import Path
 import numpy as np
 from PIL import Image
+from contextlib import contextmanager
 from datetime import timedelta
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Callable, Sequence
 import h5py
 
+try:
+    import tifffile
+except ImportError:  # pragma: no cover - tifffile ships with scikit-image
+    tifffile = None
+
+try:
+    import cupy
+except ImportError:  # pragma: no cover - GPU display is optional
+    cupy = None
+
 from PySide6.QtCore import (
     QEvent,
     QRectF,
@@ -49,6 +60,7 @@ from ..logic.geometry import (
     axis_micrometre_to_axis_pixels,
     axis_micrometre_to_global,
     axis_pixels_to_axis_micrometre,
+    rectangle_corners,
 )
 from ..logic.sequence import PatternSequence
 from ..logic import saving
@@ -66,6 +78,202 @@ from .capture_tools import (
 
 
 _HDF5_FILE_FILTER = "HDF5 files (*.h5 *.hdf5);;All files (*)"
+# Number of values sampled when estimating percentile contrast levels.
+_LEVELS_SAMPLE_SIZE = 1_000_000
+# Upper bound on live camera redraws; faster frame streams drop frames.
+_MAX_REDRAW_RATE_HZ = 30
+# Displayed frames above this size are written to a temporary file while the
+# calibration workflow shows its own image, instead of being held in RAM.
+_SPILL_IMAGE_BYTES = 16 * 1024 * 1024
+_TIFF_SUFFIXES = (".tif", ".tiff")
+# Frame dtypes passed to the ImageItem unchanged; anything else becomes float32.
+_DISPLAY_DTYPES = (np.dtype(np.uint8), np.dtype(np.uint16), np.dtype(np.float32))
+_IMAGE_SUFFIXES = frozenset((".png", ".jpg", ".jpeg", ".gif") + _TIFF_SUFFIXES)
+
+
+def _percentile_level(values: np.ndarray, percentile: float) -> float:
+    """Return the ``percentile`` of a 1-D array of pixel values.
+
+    8/16-bit camera data is counted with ``np.bincount`` and read off the
+    cumulative histogram in one linear pass (lower rank, i.e.
+    ``np.percentile(..., method='lower')``); other dtypes fall back to
+    ``np.percentile``. Unlike that float path, integer frames do not
+    interpolate between neighbouring values, so their clip levels can sit
+    slightly below the interpolated ones.
+    """
+    if values.dtype in (np.uint8, np.uint16):
+        cdf = np.cumsum(np.bincount(values, minlength=1 << (8 * values.itemsize)))
+        rank = percentile / 100.0 * (cdf[-1] - 1)
+        return float(np.searchsorted(cdf, rank, side="right"))
+    return float(np.percentile(values, percentile))
+
+
+def _finite_values(values: np.ndarray) -> np.ndarray:
+    """Return ``values`` without NaN/inf, copying only when some are present."""
+    finite = np.isfinite(values)
+    return values if finite.all() else values[finite]
+
+
+def _map_point_sets(
+    point_sets: Sequence[np.ndarray], convert: Callable[[np.ndarray], np.ndarray]
+) -> list[np.ndarray]:
+    """Apply the vectorised ``convert`` to several ``(N, 2)`` arrays at once.
+
+    The sets are stacked, converted in one call and split back in order.
+    """
+    if not point_sets:
+        return []
+    sizes = [pts.shape[0] for pts in point_sets]
+    converted = convert(np.concatenate(point_sets, axis=0))
+    return np.split(converted, np.cumsum(sizes)[:-1])
+
+
+def _spill_image(image: np.ndarray) -> str | None:
+    """Write ``image`` to a temporary ``.npy`` file and return its path.
+
+    Returns ``None`` (leaving the caller to keep the array) if it can't be written.
+    """
+    fd, path = tempfile.mkstemp(prefix="stim1p-", suffix=".npy")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.save(handle, image, allow_pickle=False)
+    except Exception:
+        _remove_file(path)
+        return None
+    return path
+
+
+def _unspill_image(path: str) -> np.ndarray | None:
+    """Read back and delete an image written by :func:`_spill_image`."""
+    try:
+        return np.load(path, allow_pickle=False)
+    except Exception:
+        return None
+    finally:
+        _remove_file(path)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _file_fingerprint(path: str, stat: os.stat_result) -> tuple[str, int, int]:
+    """Identify the on-disk version of an image file."""
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_image_file(
+    path: str | os.PathLike, *, memory_map: bool = False
+) -> np.ndarray:
+    """Decode the image at ``path`` into a NumPy array.
+
+    TIFF frames (the first page of multi-page files) are decoded by
+    ``tifffile`` straight into an ndarray when it is available; other formats
+    (and TIFFs it cannot read) go through Pillow.
+    With ``memory_map`` set, single-page uncompressed TIFFs are returned as a
+    read-only memory map of the file instead of being copied into RAM.
+    """
+    if tifffile is not None and Path(path).suffix.lower() in _TIFF_SUFFIXES:
+        if memory_map:
+            try:
+                # Only single-page files whose pixels are stored uncompressed
+                # and contiguously map to one (H, W) frame.
+                with tifffile.TiffFile(path) as tiff:
+                    mappable = len(tiff.pages) == 1 and tiff.pages[0].is_memmappable
+                if mappable:
+                    return tifffile.memmap(path, mode="r")
+            except Exception:
+                pass
+        try:
+            # Only the first page, like Pillow: multi-page files would otherwise
+            # come back as a (pages, H, W) stack.
+            return tifffile.imread(path, key=0)
+        except Exception:
+            pass
+    with Image.open(path) as pil_image:
+        # asarray wraps Pillow's decoded buffer (read-only) instead of copying it.
+        return np.asarray(pil_image)
+
+
+def _affine_2d(
+    points: np.ndarray,
+    rotation: np.ndarray,
+    origin: np.ndarray,
+    inverse: bool = False,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Map row-vector ``points`` between the camera and axis frames.
+
+    The forward direction subtracts ``origin`` and rotates by ``rotation.T``
+    (camera -> axis); ``inverse`` rotates by ``rotation`` and adds ``origin``
+    back (axis -> camera). ``out`` receives the result of the inverse direction
+    without allocating intermediates.
+    """
+    if inverse:
+        if out is None:
+            return points @ rotation.T + origin
+        np.matmul(points, rotation.T, out=out)
+        out += origin
+        return out
+    return (points - origin) @ rotation
+
+
+# Image corners as fractions of (width, height), in the same winding order as
+# geometry.rectangle_corners: (-u, -v), (+u, -v), (+u, +v), (-u, +v).
+_IMAGE_CORNER_UNITS = np.array(
+    [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], dtype=float
+)
+
+_ROTATION_GENERAL = "general"
+_ROTATION_IDENTITY = "identity"
+_ROTATION_90 = "rot90"
+_ROTATION_180 = "rot180"
+_ROTATION_270 = "rot270"
+
+
+def _classify_rotation(cos_a: float, sin_a: float) -> str:
+    """Classify an axis rotation as one of the right-angle cases or general."""
+    if abs(sin_a) < 1e-12:
+        return _ROTATION_IDENTITY if cos_a > 0.0 else _ROTATION_180
+    if abs(cos_a) < 1e-12:
+        return _ROTATION_90 if sin_a > 0.0 else _ROTATION_270
+    return _ROTATION_GENERAL
+
+
+def _right_angle_affine(
+    points: np.ndarray,
+    mode: str,
+    origin: np.ndarray,
+    inverse: bool = False,
+) -> np.ndarray:
+    """Same mapping as :func:`_affine_2d` for right-angle rotations, without a matmul."""
+    if inverse:
+        if mode == _ROTATION_IDENTITY:
+            return points + origin
+        x = points[..., 0]
+        y = points[..., 1]
+        if mode == _ROTATION_90:
+            rotated = (-y, x)
+        elif mode == _ROTATION_180:
+            rotated = (-x, -y)
+        else:
+            rotated = (y, -x)
+        return np.stack(rotated, axis=-1) + origin
+    relative = points - origin
+    if mode == _ROTATION_IDENTITY:
+        return relative
+    dx = relative[..., 0]
+    dy = relative[..., 1]
+    if mode == _ROTATION_90:
+        rotated = (dy, -dx)
+    elif mode == _ROTATION_180:
+        rotated = (-dx, -dy)
+    else:
+        rotated = (-dy, dx)
+    return np.stack(rotated, axis=-1)
 
 
 class _MicrometreAxisItem(pg.AxisItem):
@@ -85,16 +293,13 @@ class _MicrometreAxisItem(pg.AxisItem):
         effective_spacing = max(spacing_um, 1e-9)
         places = max(0, int(np.ceil(-np.log10(effective_spacing))))
         places = min(places, 6)
-        strings: list[str] = []
-        for value in values:
-            val_um = float(value) * per_unit
-            if abs(val_um) < 1e-9:
-                val_um = 0.0
-            if abs(val_um) < 1e-3 or abs(val_um) >= 1e4:
-                label = f"{val_um:g}"
-            else:
-                label = f"{val_um:.{places}f}"
-            strings.append(label)
+        vals_um = np.asarray(values, dtype=float) * per_unit
+        abs_vals = np.abs(vals_um)
+        vals_um[abs_vals < 1e-9] = 0.0
+        strings: list[str] = np.char.mod(f"%.{places}f", vals_um).tolist()
+        # Very small/large values read better in %g; they are rare at usual zooms.
+        for idx in np.flatnonzero((abs_vals < 1e-3) | (abs_vals >= 1e4)):
+            strings[idx] = f"{float(vals_um[idx]):g}"
         return strings
 
 
@@ -310,39 +515,73 @@ class _CyclePatternsDialog(QDialog):
 class _GridPreviewOverlay:
     """Render a temporary preview of rectangles on top of the plot."""
 
+    # Curves released by cleared overlays, reused instead of building new items.
+    _CURVE_POOL: list[pg.PlotCurveItem] = []
+
     def __init__(self, plot_item: pg.PlotItem):
         self._plot_item = plot_item
-        self._items: list[pg.PlotCurveItem] = []
         self._pen = pg.mkPen(color=(0, 200, 255, 200), width=2, style=Qt.PenStyle.DashLine)
-
-    def set_rectangles(self, rectangles: Sequence[np.ndarray]) -> None:
-        rectangles = [np.asarray(rect, dtype=float) for rect in rectangles]
-        required = len(rectangles)
-        while len(self._items) < required:
-            item = pg.PlotCurveItem(pen=self._pen)
-            item.setZValue(8_750)
-            item.hide()
-            self._plot_item.addItem(item)
-            self._items.append(item)
-        for idx, rect in enumerate(rectangles):
-            item = self._items[idx]
-            if rect.ndim != 2 or rect.shape[1] != 2:
-                item.hide()
-                continue
-            closed = np.vstack([rect, rect[0]])
-            item.setData(closed[:, 0], closed[:, 1])
-            item.show()
-        for idx in range(len(rectangles), len(self._items)):
-            self._items[idx].hide()
+        # All rectangles share one curve; ``connect`` breaks the line between them.
+        self._curve: pg.PlotCurveItem | None = None
+
+    def _ensure_curve(self) -> pg.PlotCurveItem:
+        if self._curve is None:
+            if self._CURVE_POOL:
+                curve = self._CURVE_POOL.pop()
+                curve.setPen(self._pen)
+            else:
+                curve = pg.PlotCurveItem(pen=self._pen)
+            curve.setZValue(8_750)
+            curve.hide()
+            self._plot_item.addItem(curve)
+            self._curve = curve
+        return self._curve
+
+    def set_rectangles(self, rectangles: Sequence[np.ndarray] | np.ndarray) -> None:
+        if isinstance(rectangles, np.ndarray) and rectangles.ndim == 3:
+            self._set_rectangle_batch(rectangles)
+            return
+        polygons = [np.asarray(rect, dtype=float) for rect in rectangles]
+        polygons = [
+            rect
+            for rect in polygons
+            if rect.ndim == 2 and rect.shape[1] == 2 and rect.shape[0] > 0
+        ]
+        if not polygons:
+            self.hide()
+            return
+        # Close every polygon and only connect consecutive vertices of the same one.
+        closed = np.concatenate([np.vstack([rect, rect[:1]]) for rect in polygons])
+        connect = np.ones(closed.shape[0], dtype=bool)
+        ends = np.cumsum([rect.shape[0] + 1 for rect in polygons]) - 1
+        connect[ends] = False
+        curve = self._ensure_curve()
+        curve.setData(closed[:, 0], closed[:, 1], connect=connect)
+        curve.show()
+
+    def _set_rectangle_batch(self, corners: np.ndarray) -> None:
+        """Draw an ``(N, K, 2)`` batch of equally sized polygons."""
+        count, vertices = corners.shape[:2]
+        if count == 0 or vertices == 0:
+            self.hide()
+            return
+        closed = np.concatenate((corners, corners[:, :1]), axis=1).reshape(-1, 2)
+        connect = np.ones(closed.shape[0], dtype=bool)
+        connect[vertices :: vertices + 1] = False
+        curve = self._ensure_curve()
+        curve.setData(closed[:, 0], closed[:, 1], connect=connect)
+        curve.show()
 
     def hide(self) -> None:
-        for item in self._items:
-            item.hide()
+        if self._curve is not None:
+            self._curve.hide()
 
     def clear(self) -> None:
-        for item in self._items:
-            self._plot_item.removeItem(item)
-        self._items.clear()
+        if self._curve is not None:
+            self._plot_item.removeItem(self._curve)
+            self._curve.setData([], [])
+            self._CURVE_POOL.append(self._curve)
+            self._curve = None
 
 
 class StimDMDWidget(QWidget):
@@ -350,6 +589,7 @@ class StimDMDWidget(QWidget):
 
     _AXIS_MODE_MOVE = "move"
     _AXIS_MODE_KEEP = "keep"
+    _IDENTITY_TRANSFORM = QTransform()
     _AXIS_BEHAVIOUR_LABELS = {
         _AXIS_MODE_MOVE: "Move patterns with the image",
         _AXIS_MODE_KEEP: "Keep patterns in place",
@@ -366,11 +606,57 @@ class StimDMDWidget(QWidget):
         self.dmd = dmd
         self._calibration: DMDCalibration | None = None
         self._current_image: np.ndarray | None = None
+        self._current_image_mapped = False
+        # (path, mtime_ns, size) of the file behind _current_image, if any;
+        # lets a folder refresh skip re-decoding an unchanged frame.
+        self._image_file_fingerprint: tuple[str, int, int] | None = None
+        # Camera-frame corners of the displayed image, refreshed in _set_image().
+        self._image_corners_camera: np.ndarray | None = None
         self._current_levels: tuple[float, float] | None = None
+        # Auto-level results for the displayed frame, keyed by (percentile, precise).
+        self._auto_levels_cache: dict[
+            tuple[tuple[float, float] | None, bool], tuple[float, float]
+        ] = {}
         self._axis_origin_camera = np.array([0.0, 0.0], dtype=float)
         self._axis_angle_rad = 0.0
+        # Trig and rotations of the current axis angle, kept by _set_axis_angle().
+        self._axis_cos = 1.0
+        self._axis_sin = 0.0
+        self._axis_R_a2c = np.eye(2, dtype=float)
+        self._axis_R_c2a = self._axis_R_a2c.T
+        self._axis_rotation_mode = _ROTATION_IDENTITY
+        # Reused camera -> axis transform of the image item (Qt copies it on set).
+        self._image_qtransform = QTransform()
+        # (origin x, origin y, angle) applied to the image item, or None while it
+        # shows the identity; new frames with an unchanged axis skip the update.
+        self._image_transform_key: tuple[float, float, float] | None = None
+        # Rotation matrix buffer, refilled only when the requested angle changes.
+        self._R_buf = np.eye(2, dtype=float)
+        self._R_buf_angle = 0.0
+        self._rotation_mode = _ROTATION_IDENTITY
         self._axis_defined = False
+        # Nesting depth of _batched_visual_updates(); while > 0 the transform and
+        # axis visual refreshes are recorded and run once on exit.
+        self._visual_batch_depth = 0
+        self._pending_image_transform = False
+        self._pending_axis_visuals = False
         self._axis_redefine_cache: _AxisRedefinitionCache | None = None
+        # Tick labels query the unit scale on every repaint; keep it until the
+        # calibration or axis changes.
+        self._axis_unit_scale_cache: dict[str, float | None] = {
+            "bottom": None,
+            "left": None,
+        }
+        self._axis_unit_scale_valid = False
+        # _axis_micrometre_scale() result for (calibration, angle); the origin
+        # does not affect the scales.
+        self._micro_scale_key: tuple[DMDCalibration, float] | None = None
+        self._micro_scale_cache: tuple[float, float] | None = None
+        # Last fitted view, keyed by image shape and (if used) the axis pose.
+        self._fit_view_key: tuple | None = None
+        self._fit_view_cache: (
+            tuple[float, tuple[float, float], tuple[float, float]] | None
+        ) = None
         # GraphicsLayoutWidget gives us fine control over plot + histogram layout.
         self._graphics_widget = pg.GraphicsLayoutWidget(parent=self)
         axis_items = {
@@ -395,8 +681,10 @@ class StimDMDWidget(QWidget):
             axis.enableAutoSIPrefix(False)
         self._update_axis_labels()
 
-        # ImageItem renders the camera frame; keep it behind ROIs.
-        self._image_item = pg.ImageItem()
+        # ImageItem renders the camera frame; keep it behind ROIs. Frames are
+        # row-major (height, width[, channels]) so they are displayed as-is,
+        # and zoomed-out views render a downsampled copy instead of every pixel.
+        self._image_item = pg.ImageItem(axisOrder="row-major", autoDownsample=True)
         self._image_item.setZValue(-1)
         # Attach image directly to the view box so it follows pans/zooms.
         self._view_box.addItem(self._image_item)
@@ -424,6 +712,8 @@ class StimDMDWidget(QWidget):
         self._axis_line_item.hide()
         self._axis_arrow_item.hide()
         self._axis_origin_item.hide()
+        # State the axis overlay was last drawn for; see _update_axis_visuals().
+        self._axis_visuals_key: tuple | None = None
         self._grid_preview_overlay: _GridPreviewOverlay | None = None
         self._grid_dialog: GridDialog | None = None
 
@@ -431,7 +721,19 @@ class StimDMDWidget(QWidget):
         self._hist_widget = pg.HistogramLUTWidget(parent=self)
         self._hist_widget.setImageItem(self._image_item)
         self._hist_widget.setMinimumWidth(140)
-        self._hist_widget.region.sigRegionChanged.connect(self._store_histogram_levels)
+        # The region emits on every drag tick; store the levels once it settles.
+        # Live frames from update_ui(): the first is drawn at once, later ones
+        # within the redraw interval only replace the pending frame.
+        self._pending_frame: np.ndarray | None = None
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(1000 // _MAX_REDRAW_RATE_HZ)
+        self._redraw_timer.timeout.connect(self._draw_pending_frame)
+        self._levels_timer = QTimer(self)
+        self._levels_timer.setSingleShot(True)
+        self._levels_timer.setInterval(100)
+        self._levels_timer.timeout.connect(self._store_histogram_levels)
+        self._hist_widget.region.sigRegionChanged.connect(self._levels_timer.start)
 
         self._image_container = QWidget(parent=self)
         container_layout = QHBoxLayout(self._image_container)
@@ -445,20 +747,42 @@ class StimDMDWidget(QWidget):
         self.tree_manager = tree_table_manager.TreeManager(self)
         self.table_manager = tree_table_manager.TableManager(self)
         self._preferences = CalibrationPreferences()
+        # Opt-in GPU display: pyqtgraph then applies levels/LUTs with CuPy and
+        # only downloads the final ARGB image. useCupy is a process-wide
+        # pyqtgraph option; the value found here is put back when GPU display
+        # is switched off or the widget is closed.
+        self._gpu_display = False
+        self._saved_use_cupy = pg.getConfigOption("useCupy")
+        self._apply_gpu_display(self._preferences.gpu_display_enabled())
         self._run_state_timer = QTimer(self)
         self._run_state_timer.setInterval(250)
         self._run_state_timer.timeout.connect(self._on_run_state_check)
         self._stim = Stim1P()
         self._run_button_default_stylesheet = self.ui.pushButton_run_now.styleSheet()
+        self._run_controls_state: tuple[bool, bool] | None = None
         self._grid_last_parameters = self._preferences.grid_parameters()
         if not self._grid_last_parameters.is_valid():
             self._grid_last_parameters = GridParameters()
         self._roi_properties_item: QTreeWidgetItem | None = None
+        # Spin box drags fire valueChanged per step; apply at most once per frame.
+        self._rect_edit_timer = QTimer(self)
+        self._rect_edit_timer.setSingleShot(True)
+        self._rect_edit_timer.setInterval(16)
+        self._rect_edit_timer.timeout.connect(self._commit_rectangle_edit)
+        # Vertices shown in the polygon table, so single-cell edits skip a rebuild.
+        self._roi_properties_cached_points: np.ndarray | None = None
+        # What the panel currently shows; refreshes with an equal signature are skipped.
+        self._roi_properties_sig: tuple | None = None
         self._updating_roi_properties = False
         self._setup_roi_properties_panel()
         self.roi_manager.shapeEdited.connect(self._on_roi_shape_edited)
+        self.roi_manager.shapesBulkEdited.connect(self._on_roi_shapes_bulk_edited)
         self._setup_axis_behaviour_controls()
-        self._setup_axis_feedback_banner()
+        # The axis feedback banner is built on first use (_ensure_axis_feedback_banner).
+        self._axis_feedback_frame: QFrame | None = None
+        # (raw path, expanded path, exists, parent exists) for the last
+        # calibration file, so the file dialogs don't re-stat it on each open.
+        self._last_calibration_location: tuple[str, Path, bool, bool] | None = None
         self._last_calibration_file_path: str = (
             self._preferences.last_calibration_file_path()
         )
@@ -489,28 +813,29 @@ class StimDMDWidget(QWidget):
             raise RuntimeError(
                 "A DMD calibration must be available before saving pattern sequences."
             )
-        patterns: list[list[np.ndarray]] = []
         descriptions: list[str] = []
         shape_types: list[list[str]] = []
-        for i in range(self.ui.treeWidget.topLevelItemCount()):
-            pattern_item = self.ui.treeWidget.topLevelItem(i)
-            assert pattern_item is not None
+        axis_point_sets: list[np.ndarray] = []
+        for pattern_item, shape_items in self.tree_manager.pattern_structure():
             descriptions.append(
                 tree_table_manager.extract_description(pattern_item.text(0))
             )
-            pattern_polys: list[np.ndarray] = []
             pattern_shapes: list[str] = []
-            for j in range(pattern_item.childCount()):
-                poly_item = pattern_item.child(j)
-                shape = self.roi_manager.get_shape(poly_item)
-                if shape is None:
+            for poly_item in shape_items:
+                axis_points = self.roi_manager.shape_points(poly_item)
+                if axis_points is None:
                     continue
-                axis_points = shape.get_points()
-                micrometre_points = self._axis_pixels_to_micrometres(axis_points)
-                pattern_polys.append(micrometre_points)
-                pattern_shapes.append(shape.shape_type)
-            patterns.append(pattern_polys)
+                axis_point_sets.append(axis_points)
+                pattern_shapes.append(self.roi_manager.get_shape_type(poly_item))
             shape_types.append(pattern_shapes)
+        # Convert every shape in one call, then regroup per pattern.
+        micrometre_sets = iter(
+            _map_point_sets(axis_point_sets, self._axis_pixels_to_micrometres)
+        )
+        patterns: list[list[np.ndarray]] = [
+            [next(micrometre_sets) for _ in pattern_shapes]
+            for pattern_shapes in shape_types
+        ]
         timings_ms, durations_ms, sequence = self._read_table_ms()
         return PatternSequence(
             patterns=patterns,
@@ -523,10 +848,7 @@ class StimDMDWidget(QWidget):
 
     @model.setter
     def model(self, model: PatternSequence):
-        self.ui.treeWidget.clear()
-        self.roi_manager.clear_all()
-        self._set_roi_properties_item(None)
-        self._next_pattern_id = 0
+        # Validate everything first so a rejected model leaves the widget untouched.
         if (
             self._calibration is None
             and any(len(pattern) for pattern in model.patterns)
@@ -534,55 +856,84 @@ class StimDMDWidget(QWidget):
             raise RuntimeError(
                 "Load or compute a DMD calibration before importing patterns."
             )
-        descs = (
-            model.descriptions
-            if model.descriptions is not None
-            else [""] * len(model.patterns)
-        )
-        shape_types = (
-            model.shape_types
-            if model.shape_types is not None
-            else [["polygon"] * len(pattern) for pattern in model.patterns]
-        )
+        micrometre_sets = [
+            np.asarray(poly_pts, dtype=float)
+            for pattern in model.patterns
+            for poly_pts in pattern
+        ]
+        for poly_pts in micrometre_sets:
+            if poly_pts.ndim != 2 or poly_pts.shape[1] != 2:
+                raise ValueError(
+                    "Pattern shapes must be arrays of shape (N, 2), "
+                    f"got {poly_pts.shape}."
+                )
+        with self._batched_visual_updates():
+            self.ui.treeWidget.clear()
+            self.roi_manager.clear_all()
+            self._set_roi_properties_item(None)
+            self._next_pattern_id = 0
+            descs = (
+                model.descriptions
+                if model.descriptions is not None
+                else [""] * len(model.patterns)
+            )
+            shape_types = (
+                model.shape_types
+                if model.shape_types is not None
+                else [["polygon"] * len(pattern) for pattern in model.patterns]
+            )
 
-        # Keep whichever axis the user already defined; if none, make sure visuals stay in sync.
-        self._update_image_transform()
-        self._update_axis_visuals()
-        for pat_idx, pattern in enumerate(model.patterns):
+            # Convert every shape in one call; consumed in order while loading.
+            axis_point_sets = iter(
+                _map_point_sets(micrometre_sets, self._micrometres_to_axis_pixels)
+            )
 
-            root = QTreeWidgetItem([""])
+            # Keep whichever axis the user already defined; if none, make sure visuals stay in sync.
+            self._update_image_transform()
+            self._update_axis_visuals()
+            tree = self.ui.treeWidget
+            # Bulk load without per-item itemChanged callbacks or repaints; labels
+            # are renumbered once at the end.
+            tree.blockSignals(True)
+            tree.setUpdatesEnabled(False)
+            try:
+                for pat_idx, pattern in enumerate(model.patterns):
 
-            self.tree_manager.attach_pattern_id(
-                root, self.tree_manager.new_pattern_id()
-            )
-            root.setFlags(root.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.ui.treeWidget.insertTopLevelItem(pat_idx, root)
-            self.tree_manager.set_pattern_label(root, pat_idx, descs[pat_idx])
-            shape_type_row = (
-                shape_types[pat_idx]
-                if pat_idx < len(shape_types)
-                else ["polygon"] * len(pattern)
-            )
-            for _poly_idx, poly_pts in enumerate(pattern):
-                shape_kind = (
-                    shape_type_row[_poly_idx]
-                    if _poly_idx < len(shape_type_row)
-                    else "polygon"
-                )
-                shape_kind = str(shape_kind).lower()
-                node = QTreeWidgetItem([shape_kind])
-                root.addChild(node)
-                points_um = np.asarray(poly_pts, dtype=float)
-                points_axis = self._micrometres_to_axis_pixels(points_um)
-                if shape_kind == "rectangle":
-                    self.roi_manager.register_rectangle(node, points_axis)
-                else:
-                    self.roi_manager.register_polygon(node, points_axis)
-        self.roi_manager.clear_visible_only()
-        self.tree_manager.renumber_pattern_labels()
-        self._write_table_ms(model)
-        self._fit_view_to_image()
-        self._update_axis_visuals()
+                    root = QTreeWidgetItem([""])
+
+                    self.tree_manager.attach_pattern_id(
+                        root, self.tree_manager.new_pattern_id()
+                    )
+                    root.setFlags(root.flags() | Qt.ItemFlag.ItemIsEditable)
+                    tree.insertTopLevelItem(pat_idx, root)
+                    self.tree_manager.set_pattern_label(root, pat_idx, descs[pat_idx])
+                    shape_type_row = (
+                        shape_types[pat_idx]
+                        if pat_idx < len(shape_types)
+                        else ["polygon"] * len(pattern)
+                    )
+                    for _poly_idx in range(len(pattern)):
+                        shape_kind = (
+                            shape_type_row[_poly_idx]
+                            if _poly_idx < len(shape_type_row)
+                            else "polygon"
+                        )
+                        shape_kind = str(shape_kind).lower()
+                        node = QTreeWidgetItem([shape_kind])
+                        root.addChild(node)
+                        points_axis = next(axis_point_sets)
+                        if shape_kind == "rectangle":
+                            self.roi_manager.register_rectangle(node, points_axis)
+                        else:
+                            self.roi_manager.register_polygon(node, points_axis)
+                self.tree_manager.renumber_pattern_labels()
+            finally:
+                tree.setUpdatesEnabled(True)
+                tree.blockSignals(False)
+            self.roi_manager.clear_visible_only()
+            self._write_table_ms(model)
+            self._fit_view_to_image()
+            self._update_axis_visuals()
 
     @property
     def calibration(self) -> DMDCalibration | None:
@@ -591,6 +942,8 @@ class StimDMDWidget(QWidget):
     @calibration.setter
     def calibration(self, calibration: DMDCalibration | None):
         self._calibration = calibration
+        self._micro_scale_key = None
+        self._invalidate_axis_unit_scale()
         self._update_axis_labels()
         self._update_listener_controls()
 
@@ -775,19 +1128,24 @@ class StimDMDWidget(QWidget):
         button = self.ui.pushButton_run_now
         running = getattr(self._stim, "is_running", False)
         listening = getattr(self._stim, "is_listening", False)
-        button.setText("Stop run now" if running else "Start run now")
-        if running:
-            button.setEnabled(True)
-            button.setStyleSheet("background-color: #c62828; color: white;")
-        else:
-            button.setStyleSheet(self._run_button_default_stylesheet)
-            prerequisites_met = (
-                self._stim.is_dmd_connected
-                and self._calibration is not None
-                and self._axis_defined
-                and not self._stim.is_listening
+        enabled = running or (
+            self._stim.is_dmd_connected
+            and self._calibration is not None
+            and self._axis_defined
+            and not listening
+        )
+        # The 4 Hz poll mostly sees an unchanged state; setStyleSheet re-polishes
+        # the button, so only touch it when something actually changed.
+        state = (running, enabled)
+        if state != self._run_controls_state:
+            self._run_controls_state = state
+            button.setText("Stop run now" if running else "Start run now")
+            button.setStyleSheet(
+                "background-color: #c62828; color: white;"
+                if running
+                else self._run_button_default_stylesheet
             )
-            button.setEnabled(prerequisites_met)
+            button.setEnabled(enabled)
         monitor_state = running or listening
         if monitor_state and not self._run_state_timer.isActive():
             self._run_state_timer.start()
@@ -827,9 +1185,7 @@ class StimDMDWidget(QWidget):
         self.ui.pushButton_connect_dmd.clicked.connect(self._toggle_dmd_connection)
         self.ui.pushButton_listen_to_matlab.clicked.connect(self._toggle_pipe_listener)
         self.ui.pushButton_run_now.clicked.connect(self._toggle_run_now)
-        self.ui.treeWidget.itemClicked.connect(
-            lambda item, _col: self.roi_manager.show_for_item(item)
-        )
+        self.ui.treeWidget.itemClicked.connect(self._on_tree_item_clicked)
         self.ui.treeWidget.itemSelectionChanged.connect(
             self._on_tree_selection_changed
         )
@@ -860,11 +1216,25 @@ class StimDMDWidget(QWidget):
 
     def closeEvent(self, event):
         self._console.restore_original_streams()
+        self._apply_gpu_display(False)
         super().closeEvent(event)
 
     def update_ui(self, data):
-        if self.dmd is not None:
-            self._set_image(data)
+        if self.dmd is None:
+            return
+        if self._redraw_timer.isActive():
+            self._pending_frame = data
+            return
+        self._set_image(data)
+        self._redraw_timer.start()
+
+    def _draw_pending_frame(self) -> None:
+        frame = self._pending_frame
+        if frame is None:
+            return
+        self._pending_frame = None
+        self._set_image(frame)
+        self._redraw_timer.start()
 
     def set_up(self):
         pass
@@ -877,10 +1247,34 @@ class StimDMDWidget(QWidget):
         return AxisDefinition(origin_camera=origin, angle_rad=float(self._axis_angle_rad))
 
     def _rotation_matrix(self, angle: float | None = None) -> np.ndarray:
+        """Return the rotation for ``angle``; the buffer is reused between calls."""
         angle = self._axis_angle_rad if angle is None else float(angle)
-        cos_a = float(np.cos(angle))
-        sin_a = float(np.sin(angle))
-        return np.array([[cos_a, -sin_a], [sin_a, cos_a]], dtype=float)
+        R = self._R_buf
+        if angle != self._R_buf_angle:
+            cos_a = math.cos(angle)
+            sin_a = math.sin(angle)
+            R[0, 0] = cos_a
+            R[0, 1] = -sin_a
+            R[1, 0] = sin_a
+            R[1, 1] = cos_a
+            self._R_buf_angle = angle
+            self._rotation_mode = _classify_rotation(cos_a, sin_a)
+        return R
+
+    def _conversion_frame(
+        self, origin: np.ndarray | None, angle: float | None
+    ) -> tuple[np.ndarray, str, np.ndarray]:
+        """Return ``(rotation, rotation mode, origin)`` for a conversion call."""
+        if origin is None and angle is None:
+            # Current axis: everything was prepared by _set_axis_angle().
+            return self._axis_R_a2c, self._axis_rotation_mode, self._axis_origin_camera
+        origin_vec = (
+            self._axis_origin_camera
+            if origin is None
+            else np.asarray(origin, dtype=float)
+        )
+        R = self._rotation_matrix(angle)
+        return R, self._rotation_mode, origin_vec
 
     def _camera_to_axis(
         self,
@@ -891,18 +1285,13 @@ class StimDMDWidget(QWidget):
     ) -> np.ndarray:
         """Convert camera pixel coordinates into the user-defined axis frame."""
         arr = np.asarray(points, dtype=float)
-        was_1d = arr.ndim == 1
-        pts = np.atleast_2d(arr)
-        origin_vec = (
-            self._axis_origin_camera
-            if origin is None
-            else np.asarray(origin, dtype=float)
-        )
-        R = self._rotation_matrix(angle)
-        relative = pts - origin_vec
-        # Rotate into the axis frame and keep the input dimensionality.
-        result = (R.T @ relative.T).T
-        return result[0] if was_1d else result
+        R, mode, origin_vec = self._conversion_frame(origin, angle)
+        if mode != _ROTATION_GENERAL:
+            return _right_angle_affine(arr, mode, origin_vec)
+        # Rotate into the axis frame; a single point is one matvec.
+        if arr.ndim == 1:
+            return R.T @ (arr - origin_vec)
+        return _affine_2d(arr, R, origin_vec)
 
     def _axis_to_camera(
         self,
@@ -913,17 +1302,13 @@ class StimDMDWidget(QWidget):
     ) -> np.ndarray:
         """Convert axis-aligned coordinates back to camera pixel indices."""
         arr = np.asarray(points, dtype=float)
-        was_1d = arr.ndim == 1
-        pts = np.atleast_2d(arr)
-        origin_vec = (
-            self._axis_origin_camera
-            if origin is None
-            else np.asarray(origin, dtype=float)
-        )
-        R = self._rotation_matrix(angle)
+        R, mode, origin_vec = self._conversion_frame(origin, angle)
+        if mode != _ROTATION_GENERAL:
+            return _right_angle_affine(arr, mode, origin_vec, inverse=True)
         # Rotate and translate back into camera coordinates.
-        result = (R @ pts.T).T + origin_vec
-        return result[0] if was_1d else result
+        if arr.ndim == 1:
+            return R @ arr + origin_vec
+        return _affine_2d(arr, R, origin_vec, inverse=True)
 
     def _axis_origin_micrometre(
         self, origin_camera: np.ndarray | None = None
@@ -935,61 +1320,97 @@ class StimDMDWidget(QWidget):
             if origin_camera is None
             else np.asarray(origin_camera, dtype=float)
         )
-        mic = self._calibration.camera_to_micrometre(origin_vec.reshape(2, 1)).T[0]
-        return np.asarray(mic, dtype=float)
+        return self._calibration.camera_points_to_micrometre(origin_vec[np.newaxis, :])[0]
 
     def _axis_pixels_to_micrometres(self, points: np.ndarray) -> np.ndarray:
         if self._calibration is None:
             raise RuntimeError("A calibration is required for micrometre conversion.")
-        return axis_pixels_to_axis_micrometre(
-            points, self._axis_definition(), self._calibration
-        )
+        scales = self._axis_micrometre_scale()
+        if scales is None:
+            # Let the geometry helper report why the scales are unusable.
+            return axis_pixels_to_axis_micrometre(
+                points, self._axis_definition(), self._calibration
+            )
+        return np.asarray(points, dtype=float) * scales
 
     def _axis_micrometre_scale(self) -> tuple[float, float] | None:
         if self._calibration is None:
             return None
+        key = self._micro_scale_key
+        if (
+            key is not None
+            and key[0] is self._calibration
+            and key[1] == self._axis_angle_rad
+        ):
+            return self._micro_scale_cache
         try:
             scales = axis_micrometre_scale(
                 self._axis_definition(), self._calibration
             )
         except Exception:
-            return None
-        scale_x = float(scales[0])
-        scale_y = float(scales[1])
-        if (
-            not np.isfinite(scale_x)
-            or not np.isfinite(scale_y)
-            or scale_x <= 0.0
-            or scale_y <= 0.0
-        ):
-            return None
-        return scale_x, scale_y
+            result = None
+        else:
+            scales_arr = np.asarray(scales, dtype=float)
+            if np.isfinite(scales_arr).all() and scales_arr.min() > 0.0:
+                result = (float(scales_arr[0]), float(scales_arr[1]))
+            else:
+                result = None
+        self._micro_scale_key = (self._calibration, self._axis_angle_rad)
+        self._micro_scale_cache = result
+        return result
 
     def _axis_unit_scale_for_orientation(self, orientation: str) -> float | None:
-        scales = self._axis_micrometre_scale()
-        if scales is None:
-            return None
+        if not self._axis_unit_scale_valid:
+            scales = self._axis_micrometre_scale()
+            self._axis_unit_scale_cache = {
+                "bottom": None if scales is None else scales[0],
+                "left": None if scales is None else scales[1],
+            }
+            self._axis_unit_scale_valid = True
         orient = orientation.lower()
         if orient in ("bottom", "top"):
-            return scales[0]
+            return self._axis_unit_scale_cache["bottom"]
         if orient in ("left", "right"):
-            return scales[1]
+            return self._axis_unit_scale_cache["left"]
         return None
 
+    def _invalidate_axis_unit_scale(self) -> None:
+        self._axis_unit_scale_valid = False
+
     def _reproject_shapes_from_cache(self, cache: _AxisRedefinitionCache) -> None:
         prev_origin = np.asarray(cache.previous_origin, dtype=float)
         prev_angle = float(cache.previous_angle)
         new_origin = np.asarray(cache.new_origin, dtype=float)
         new_angle = float(cache.new_angle)
-        for item, (axis_points, shape_type) in cache.shapes.items():
-            axis_pts = np.asarray(axis_points, dtype=float)
-            camera_pts = self._axis_to_camera(axis_pts, origin=prev_origin, angle=prev_angle)
-            axis_pts_new = self._camera_to_axis(camera_pts, origin=new_origin, angle=new_angle)
-            self.roi_manager.update_shape(item, shape_type, axis_pts_new)
+        if not cache.shapes:
+            return
+        # previous axis -> camera -> new axis collapses to one rotation by
+        # (prev - new) followed by a constant offset.
+        delta = prev_angle - new_angle
+        cos_d, sin_d = math.cos(delta), math.sin(delta)
+        rotation = np.array([[cos_d, -sin_d], [sin_d, cos_d]], dtype=float)
+        cos_n, sin_n = math.cos(new_angle), math.sin(new_angle)
+        dx, dy = prev_origin - new_origin
+        offset = np.array(
+            [cos_n * dx + sin_n * dy, -sin_n * dx + cos_n * dy], dtype=float
+        )
+        items = list(cache.shapes.keys())
+        reprojected = _map_point_sets(
+            [axis_points for axis_points, _shape_type in cache.shapes.values()],
+            lambda stacked: _affine_2d(
+                stacked, rotation, offset, inverse=True, out=np.empty_like(stacked)
+            ),
+        )
+        self.roi_manager.update_shapes_bulk(
+            (item, cache.shapes[item][1], axis_pts_new)
+            for item, axis_pts_new in zip(items, reprojected)
+        )
 
     def _restore_shapes_from_cache(self, cache: _AxisRedefinitionCache) -> None:
-        for item, (axis_points, shape_type) in cache.shapes.items():
-            self.roi_manager.update_shape(item, shape_type, axis_points)
+        self.roi_manager.update_shapes_bulk(
+            (item, shape_type, axis_points)
+            for item, (axis_points, shape_type) in cache.shapes.items()
+        )
 
     def _setup_axis_behaviour_controls(self) -> None:
         combo = self.ui.comboBox_axis_behaviour
@@ -1015,7 +1436,9 @@ class StimDMDWidget(QWidget):
         combo.blockSignals(False)
         combo.currentIndexChanged.connect(self._on_axis_behaviour_combo_changed)
 
-    def _setup_axis_feedback_banner(self) -> None:
+    def _ensure_axis_feedback_banner(self) -> None:
+        if self._axis_feedback_frame is not None:
+            return
         frame = QFrame(self.ui.verticalLayoutWidget)
         frame.setObjectName("axisBehaviourBanner")
         frame.setFrameShape(QFrame.Shape.StyledPanel)
@@ -1079,16 +1502,21 @@ class StimDMDWidget(QWidget):
             return
         behaviour = cache.behaviour or self._default_axis_behaviour()
         description = self._axis_behaviour_label(behaviour)
+        self._ensure_axis_feedback_banner()
         self._axis_feedback_label.setText(f'Axis updated; patterns set to "{description}". Change?')
         self._refresh_axis_feedback_buttons(behaviour)
         self._axis_feedback_frame.setVisible(True)
         self._axis_feedback_timer.start(6000)
 
     def _hide_axis_feedback_banner(self) -> None:
+        if self._axis_feedback_frame is None:
+            return
         self._axis_feedback_timer.stop()
         self._axis_feedback_frame.setVisible(False)
 
     def _refresh_axis_feedback_buttons(self, behaviour: str) -> None:
+        if self._axis_feedback_frame is None:
+            return
         move_active = behaviour == self._AXIS_MODE_MOVE
         keep_active = behaviour == self._AXIS_MODE_KEEP
         self._axis_feedback_move_button.setEnabled(not move_active)
@@ -1126,9 +1554,12 @@ class StimDMDWidget(QWidget):
     def _micrometres_to_axis_pixels(self, points_um: np.ndarray) -> np.ndarray:
         if self._calibration is None:
             raise RuntimeError("A calibration is required for micrometre conversion.")
-        return axis_micrometre_to_axis_pixels(
-            points_um, self._axis_definition(), self._calibration
-        )
+        scales = self._axis_micrometre_scale()
+        if scales is None:
+            return axis_micrometre_to_axis_pixels(
+                points_um, self._axis_definition(), self._calibration
+            )
+        return np.asarray(points_um, dtype=float) / scales
 
     def _setup_roi_properties_panel(self) -> None:
         stack = self.ui.stackedWidget_roi_properties
@@ -1156,6 +1587,8 @@ class StimDMDWidget(QWidget):
         self.ui.doubleSpinBox_rect_angle.setSingleStep(1.0)
 
     def _show_roi_placeholder(self) -> None:
+        self._roi_properties_cached_points = None
+        self._roi_properties_sig = None
         table = self.ui.tableWidget_polygon_points
         self._updating_roi_properties = True
         try:
@@ -1169,42 +1602,60 @@ class StimDMDWidget(QWidget):
         )
 
     def _populate_polygon_properties(self, shape: roi_manager.PolygonShape) -> None:
-        points = np.asarray(shape.get_points(), dtype=float)
+        points = shape.get_points()
+        sig = (shape, points.shape[0], points.tobytes())
+        if sig == self._roi_properties_sig:
+            return
+        self._roi_properties_sig = sig
+        self._roi_properties_cached_points = points
         table = self.ui.tableWidget_polygon_points
+        texts = np.char.mod("%.6f", points).tolist()
         self._updating_roi_properties = True
+        signals_were_blocked = table.blockSignals(True)
+        # One repaint for the whole refresh instead of one per changed cell.
+        table.setUpdatesEnabled(False)
         try:
-            table.blockSignals(True)
-            table.setRowCount(points.shape[0])
-            for row in range(points.shape[0]):
-                for col in range(2):
-                    value = float(points[row, col]) if points.size else 0.0
-                    text = f"{value:.6f}"
-                    existing = table.item(row, col)
+            # Same vertex count: update texts in place and skip Qt's row relayout.
+            if table.rowCount() != points.shape[0]:
+                table.setRowCount(points.shape[0])
+            item_at = table.item
+            for row, row_texts in enumerate(texts):
+                for col, text in enumerate(row_texts):
+                    existing = item_at(row, col)
                     if existing is None:
                         table.setItem(row, col, QTableWidgetItem(text))
                     else:
                         existing.setText(text)
         finally:
-            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.blockSignals(signals_were_blocked)
             self._updating_roi_properties = False
         self.ui.stackedWidget_roi_properties.setCurrentWidget(
             self.ui.page_roi_polygon
         )
 
+    @staticmethod
+    def _rectangle_properties_sig(
+        shape: roi_manager.RectangleShape,
+    ) -> tuple[roi_manager.RectangleShape, float, float, float]:
+        """Return ``(shape, width, height, angle)`` as shown in the spin boxes."""
+        state = shape.roi.state
+        width, height = state.get("size", (0.0, 0.0))
+        return (shape, float(width), float(height), float(state.get("angle", 0.0)))
+
     def _populate_rectangle_properties(
         self, shape: roi_manager.RectangleShape
     ) -> None:
-        state = dict(shape.roi.state)
-        width, height = state.get("size", (0.0, 0.0))
-        angle = float(state.get("angle", 0.0))
-        width = float(width)
-        height = float(height)
+        sig = self._rectangle_properties_sig(shape)
+        if sig == self._roi_properties_sig:
+            return
+        self._roi_properties_sig = sig
         spins = (
             self.ui.doubleSpinBox_rect_width,
             self.ui.doubleSpinBox_rect_height,
             self.ui.doubleSpinBox_rect_angle,
         )
-        values = (width, height, angle)
+        values = sig[1:]
         self._updating_roi_properties = True
         try:
             for spin, value in zip(spins, values):
@@ -1237,6 +1688,12 @@ class StimDMDWidget(QWidget):
             self._show_roi_placeholder()
 
     def _set_roi_properties_item(self, item: QTreeWidgetItem | None) -> None:
+        if self._rect_edit_timer.isActive():
+            # Apply a pending edit to the rectangle it was made for.
+            self._rect_edit_timer.stop()
+            self._commit_rectangle_edit()
+        self._roi_properties_cached_points = None
+        self._roi_properties_sig = None
         if item is None or not self.roi_manager.have_item(item):
             self._roi_properties_item = None
             self._show_roi_placeholder()
@@ -1244,6 +1701,9 @@ class StimDMDWidget(QWidget):
         self._roi_properties_item = item
         self._refresh_roi_properties()
 
+    def _on_tree_item_clicked(self, item: QTreeWidgetItem, _column: int) -> None:
+        self.roi_manager.show_for_item(item)
+
     def _on_tree_selection_changed(self) -> None:
         items = self.ui.treeWidget.selectedItems()
         if not items:
@@ -1258,9 +1718,15 @@ class StimDMDWidget(QWidget):
         self._set_roi_properties_item(roi_item)
 
     def _on_roi_shape_edited(self, item: QTreeWidgetItem) -> None:
+        if self._updating_roi_properties:
+            return
         if item is self._roi_properties_item:
             self._refresh_roi_properties()
 
+    def _on_roi_shapes_bulk_edited(self, items: list[QTreeWidgetItem]) -> None:
+        if any(item is self._roi_properties_item for item in items):
+            self._refresh_roi_properties()
+
     def _on_polygon_point_changed(self, table_item: QTableWidgetItem) -> None:
         if self._updating_roi_properties or table_item is None:
             return
@@ -1275,7 +1741,11 @@ class StimDMDWidget(QWidget):
         except (TypeError, ValueError):
             self._refresh_roi_properties()
             return
-        points = np.asarray(shape.get_points(), dtype=float)
+        points = self._roi_properties_cached_points
+        # Vertices added on the ROI itself don't refresh the table; rebuild then.
+        rebuild = points is None or points.shape[0] != len(shape.roi.getHandles())
+        if rebuild:
+            points = shape.get_points()
         row = table_item.row()
         col = table_item.column()
         if row < 0 or col < 0:
@@ -1283,13 +1753,29 @@ class StimDMDWidget(QWidget):
         if row >= points.shape[0] or col >= points.shape[1]:
             return
         points[row, col] = value
-        shape.set_points(points)
-        self.roi_manager.shapeEdited.emit(item)
-        self._refresh_roi_properties()
+        self._updating_roi_properties = True
+        try:
+            shape.set_points(points)
+            self.roi_manager.shapeEdited.emit(item)
+        finally:
+            self._updating_roi_properties = False
+        if rebuild:
+            self._refresh_roi_properties()
+            return
+        table = self.ui.tableWidget_polygon_points
+        table.blockSignals(True)
+        try:
+            table_item.setText(f"{value:.6f}")
+        finally:
+            table.blockSignals(False)
+        self._roi_properties_sig = (shape, points.shape[0], points.tobytes())
 
     def _on_rectangle_property_changed(self, _value: float) -> None:
         if self._updating_roi_properties:
             return
+        self._rect_edit_timer.start()
+
+    def _commit_rectangle_edit(self) -> None:
         item = self._roi_properties_item
         if item is None:
             return
@@ -1299,38 +1785,62 @@ class StimDMDWidget(QWidget):
         width = max(float(self.ui.doubleSpinBox_rect_width.value()), 1e-6)
         height = max(float(self.ui.doubleSpinBox_rect_height.value()), 1e-6)
         angle = float(self.ui.doubleSpinBox_rect_angle.value())
-        points = np.asarray(shape.get_points(), dtype=float)
+        points = shape.get_points()
         if points.shape[0] < 4:
             return
         center = np.mean(points, axis=0)
-        angle_rad = math.radians(angle)
-        u = np.array([math.cos(angle_rad), math.sin(angle_rad)], dtype=float)
-        v = np.array([-u[1], u[0]], dtype=float)
-        half_w = 0.5 * width
-        half_h = 0.5 * height
-        new_points = np.array(
-            [
-                center - half_w * u - half_h * v,
-                center + half_w * u - half_h * v,
-                center + half_w * u + half_h * v,
-                center - half_w * u + half_h * v,
-            ],
-            dtype=float,
-        )
-        shape.set_points(new_points)
-        self.roi_manager.shapeEdited.emit(item)
-        self._refresh_roi_properties()
+        new_points = rectangle_corners(center, width, height, math.radians(angle))
+        self._updating_roi_properties = True
+        try:
+            shape.set_points(new_points)
+            self.roi_manager.shapeEdited.emit(item)
+        finally:
+            self._updating_roi_properties = False
+        sig = self._rectangle_properties_sig(shape)
+        if np.allclose(sig[1:], (width, height, angle), rtol=0.0, atol=1e-9):
+            # The spin boxes already show the new geometry; just record it so
+            # a later refresh for this state is skipped.
+            self._roi_properties_sig = sig
+        else:
+            self._refresh_roi_properties()
+
+    @contextmanager
+    def _batched_visual_updates(self):
+        """Coalesce image transform and axis visual refreshes until exit."""
+        self._visual_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._visual_batch_depth -= 1
+            if self._visual_batch_depth == 0:
+                if self._pending_image_transform:
+                    self._pending_image_transform = False
+                    self._update_image_transform()
+                if self._pending_axis_visuals:
+                    self._pending_axis_visuals = False
+                    self._update_axis_visuals()
 
     def _update_image_transform(self) -> None:
+        self._invalidate_axis_unit_scale()
+        if self._visual_batch_depth:
+            self._pending_image_transform = True
+            return
         if not self._axis_defined:
-            self._image_item.setTransform(QTransform())
+            if self._image_transform_key is not None:
+                self._image_item.setTransform(self._IDENTITY_TRANSFORM)
+                self._image_transform_key = None
+            return
+        origin = self._axis_origin_camera.reshape(2)
+        ox, oy = float(origin[0]), float(origin[1])
+        key = (ox, oy, self._axis_angle_rad)
+        if key == self._image_transform_key:
             return
-        ox, oy = self._axis_origin_camera.astype(float)
-        cos_a = float(np.cos(self._axis_angle_rad))
-        sin_a = float(np.sin(self._axis_angle_rad))
+        cos_a = self._axis_cos
+        sin_a = self._axis_sin
         tx = -(cos_a * ox + sin_a * oy)
         ty = sin_a * ox - cos_a * oy
-        transform = QTransform(
+        transform = self._image_qtransform
+        transform.setMatrix(
             cos_a,
             -sin_a,
             0.0,
@@ -1342,24 +1852,43 @@ class StimDMDWidget(QWidget):
             1.0,
         )
         self._image_item.setTransform(transform)
+        self._image_transform_key = key
 
     def _image_axis_bounds(self) -> tuple[float, float, float, float]:
         if self._current_image is None:
             return (-50.0, 50.0, -50.0, 50.0)
-        height, width = self._current_image.shape[:2]
-        corners_camera = np.array(
-            [[0.0, 0.0], [float(width), 0.0], [float(width), float(height)], [0.0, float(height)]],
-            dtype=float,
+        corners_camera = self._image_corners_camera
+        if corners_camera is None:
+            height, width = self._current_image.shape[:2]
+            corners_camera = _IMAGE_CORNER_UNITS * np.array(
+                [float(width), float(height)], dtype=float
+            )
+            self._image_corners_camera = corners_camera
+        corners_axis = _affine_2d(
+            corners_camera, self._axis_R_a2c, self._axis_origin_camera
         )
-        corners_axis = self._camera_to_axis(corners_camera)
-        min_x = float(np.min(corners_axis[:, 0]))
-        max_x = float(np.max(corners_axis[:, 0]))
-        min_y = float(np.min(corners_axis[:, 1]))
-        max_y = float(np.max(corners_axis[:, 1]))
-        return min_x, max_x, min_y, max_y
+        mins = corners_axis.min(axis=0)
+        maxs = corners_axis.max(axis=0)
+        return float(mins[0]), float(maxs[0]), float(mins[1]), float(maxs[1])
 
     def _update_axis_visuals(self) -> None:
+        if self._visual_batch_depth:
+            self._pending_axis_visuals = True
+            return
         show = self._axis_defined
+        if show:
+            # The overlay only depends on the axis frame and the image size, so
+            # new frames of the same size leave it untouched.
+            image_shape = (
+                None if self._current_image is None else self._current_image.shape[:2]
+            )
+            ox, oy = self._axis_origin_camera
+            key = (True, image_shape, float(ox), float(oy), self._axis_angle_rad)
+        else:
+            key = (False,)
+        if key == self._axis_visuals_key:
+            return
+        self._axis_visuals_key = key
         for item in (self._axis_line_item, self._axis_arrow_item, self._axis_origin_item):
             item.setVisible(show)
         if not show:
@@ -1374,7 +1903,7 @@ class StimDMDWidget(QWidget):
         self._axis_origin_item.setData([origin_x], [origin_y])
 
     def _update_zoom_constraints(self, _width: int, _height: int) -> None:
-        view_box = self._get_view_box()
+        view_box = self._view_box
         view_box.setLimits(
             minXRange=1.0,
             minYRange=1.0,
@@ -1383,32 +1912,74 @@ class StimDMDWidget(QWidget):
         )
 
     def _fit_view_to_image(self, *, use_axis: bool = True) -> None:
-        if use_axis and self._axis_defined:
-            min_x, max_x, min_y, max_y = self._image_axis_bounds()
+        use_axis = use_axis and self._axis_defined
+        shape = None if self._current_image is None else self._current_image.shape[:2]
+        if use_axis:
+            origin = self._axis_origin_camera.reshape(2)
+            key = (shape, True, self._axis_angle_rad, float(origin[0]), float(origin[1]))
+        else:
+            key = (shape, False)
+        if key == self._fit_view_key:
+            span, x_range, y_range = self._fit_view_cache
         else:
-            if self._current_image is None:
+            if use_axis:
+                min_x, max_x, min_y, max_y = self._image_axis_bounds()
+            elif shape is None:
                 min_x = max_x = min_y = max_y = 0.0
             else:
-                height, width = self._current_image.shape[:2]
+                height, width = shape
                 min_x, max_x = 0.0, float(width)
                 min_y, max_y = 0.0, float(height)
-        span_x = max_x - min_x
-        span_y = max_y - min_y
-        span = max(span_x, span_y, 1.0)
-        margin = max(span * 0.05, 1.0)
-        half_span = span / 2.0 + margin
-        center_x = (min_x + max_x) / 2.0
-        center_y = (min_y + max_y) / 2.0
-        x_range = (center_x - half_span, center_x + half_span)
-        y_range = (center_y - half_span, center_y + half_span)
+            span_x = max_x - min_x
+            span_y = max_y - min_y
+            span = max(span_x, span_y, 1.0)
+            margin = max(span * 0.05, 1.0)
+            half_span = span / 2.0 + margin
+            center_x = (min_x + max_x) / 2.0
+            center_y = (min_y + max_y) / 2.0
+            x_range = (center_x - half_span, center_x + half_span)
+            y_range = (center_y - half_span, center_y + half_span)
+            self._fit_view_key = key
+            self._fit_view_cache = (span, x_range, y_range)
         self._update_zoom_constraints(int(span), int(span))
-        self._get_view_box().setRange(xRange=x_range, yRange=y_range, padding=0.0)
+        self._set_view_range(x_range, y_range)
+
+    def _set_view_range(
+        self, x_range: Sequence[float], y_range: Sequence[float]
+    ) -> None:
+        """Show ``x_range``/``y_range`` unless the view already shows them."""
+        view_box = self._view_box
+        (cur_x0, cur_x1), (cur_y0, cur_y1) = view_box.viewRange()
+        # Anything below a millionth of the span is far under one screen pixel.
+        eps_x = 1e-6 * max(abs(cur_x1 - cur_x0), 1.0)
+        eps_y = 1e-6 * max(abs(cur_y1 - cur_y0), 1.0)
+        if (
+            abs(x_range[0] - cur_x0) <= eps_x
+            and abs(x_range[1] - cur_x1) <= eps_x
+            and abs(y_range[0] - cur_y0) <= eps_y
+            and abs(y_range[1] - cur_y1) <= eps_y
+            and not any(view_box.autoRangeEnabled())
+        ):
+            return
+        view_box.setRange(xRange=x_range, yRange=y_range, padding=0.0)
+
+    def _set_axis_angle(self, angle_rad: float) -> None:
+        angle = float(angle_rad)
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        self._axis_angle_rad = angle
+        self._axis_cos = cos_a
+        self._axis_sin = sin_a
+        self._axis_R_a2c = np.array([[cos_a, -sin_a], [sin_a, cos_a]], dtype=float)
+        self._axis_R_c2a = self._axis_R_a2c.T
+        self._axis_rotation_mode = _classify_rotation(cos_a, sin_a)
 
     def _set_axis_state(
         self, origin_camera: np.ndarray, angle_rad: float, defined: bool
     ) -> None:
+        self._micro_scale_key = None
         self._axis_origin_camera = np.asarray(origin_camera, dtype=float)
-        self._axis_angle_rad = float(angle_rad)
+        self._set_axis_angle(angle_rad)
         self._axis_defined = defined
         self._update_image_transform()
         self._update_axis_visuals()
@@ -1424,7 +1995,7 @@ class StimDMDWidget(QWidget):
         """Apply an axis redefinition using the supplied behaviour."""
 
         self._axis_origin_camera = np.asarray(cache.new_origin, dtype=float)
-        self._axis_angle_rad = float(cache.new_angle)
+        self._set_axis_angle(cache.new_angle)
         self._axis_defined = True
         self._update_image_transform()
 
@@ -1465,6 +2036,11 @@ class StimDMDWidget(QWidget):
         menu.addSeparator()
         reset_levels_action = menu.addAction("Reset histogram region")
         reset_levels_action.triggered.connect(self._reset_histogram_region)
+        if cupy is not None:
+            gpu_action = menu.addAction("Use GPU for display (CuPy)")
+            gpu_action.setCheckable(True)
+            gpu_action.setChecked(self._gpu_display)
+            gpu_action.toggled.connect(self._on_gpu_display_toggled)
 
     def _apply_saved_preferences(self) -> None:
         last_image_path = self._preferences.last_calibration_image_path()
@@ -1524,9 +2100,15 @@ class StimDMDWidget(QWidget):
         points: np.ndarray,
         shape_type: str,
     ) -> QTreeWidgetItem:
-        points = np.asarray(points, dtype=float)
-        if points.ndim != 2 or points.shape[1] != 2:
-            raise ValueError("ROI points must be an array of shape (N, 2).")
+        if not (
+            isinstance(points, np.ndarray)
+            and points.dtype == np.float64
+            and points.ndim == 2
+            and points.shape[1] == 2
+        ):
+            points = np.asarray(points, dtype=float)
+            if points.ndim != 2 or points.shape[1] != 2:
+                raise ValueError("ROI points must be an array of shape (N, 2).")
         shape_type = str(shape_type).lower()
         label = "rectangle" if shape_type == "rectangle" else "polygon"
         node = QTreeWidgetItem([label])
@@ -1573,7 +2155,11 @@ class StimDMDWidget(QWidget):
             button.setEnabled(True)
         if not points or len(points) < 3:
             return
-        array = np.array([[pt.x(), pt.y()] for pt in points], dtype=float)
+        array = np.fromiter(
+            (coord for pt in points for coord in (pt.x(), pt.y())),
+            dtype=float,
+            count=2 * len(points),
+        ).reshape(-1, 2)
         self._create_roi_item(parent_item, array, "polygon")
 
     def _ensure_grid_preview_overlay(self) -> _GridPreviewOverlay:
@@ -1601,8 +2187,8 @@ class StimDMDWidget(QWidget):
         if params.is_valid():
             self._preferences.set_grid_parameters(params)
         overlay = self._ensure_grid_preview_overlay()
-        rectangles = params.rectangle_points()
-        if rectangles:
+        rectangles = params.rectangle_corners()
+        if len(rectangles):
             overlay.set_rectangles(rectangles)
         else:
             overlay.hide()
@@ -1612,29 +2198,47 @@ class StimDMDWidget(QWidget):
         if dialog is None:
             return
         params = dialog.parameters()
-        rectangles = params.rectangle_points()
-        if not rectangles:
+        rectangles = params.rectangle_corners()
+        total = len(rectangles)
+        if not total:
             return
         description_base = f"Grid {params.rows}x{params.columns}"
-        total = len(rectangles)
-        for idx, rect in enumerate(rectangles, start=1):
-            self.tree_manager.add_pattern()
-            pattern_index = self.ui.treeWidget.topLevelItemCount() - 1
-            pattern_item = self.ui.treeWidget.topLevelItem(pattern_index)
-            if pattern_item is None:
-                continue
-            suffix = "" if total == 1 else f" ({idx}/{total})"
-            self.tree_manager.set_pattern_label(
-                pattern_item, pattern_index, f"{description_base}{suffix}"
-            )
-            self._create_roi_item(pattern_item, rect, "rectangle")
-        if rectangles:
+        tree = self.ui.treeWidget
+        first_index = tree.topLevelItemCount()
+        node: QTreeWidgetItem | None = None
+        # Same bulk path as the model setter: add_pattern() renumbers every
+        # label per call, so insert directly and renumber once at the end.
+        tree.blockSignals(True)
+        tree.setUpdatesEnabled(False)
+        try:
+            for idx, rect in enumerate(rectangles, start=1):
+                pattern_index = first_index + idx - 1
+                pattern_item = QTreeWidgetItem([""])
+                self.tree_manager.attach_pattern_id(
+                    pattern_item, self.tree_manager.new_pattern_id()
+                )
+                pattern_item.setFlags(pattern_item.flags() | Qt.ItemFlag.ItemIsEditable)
+                tree.insertTopLevelItem(pattern_index, pattern_item)
+                suffix = "" if total == 1 else f" ({idx}/{total})"
+                self.tree_manager.set_pattern_label(
+                    pattern_item, pattern_index, f"{description_base}{suffix}"
+                )
+                node = QTreeWidgetItem(["rectangle"])
+                pattern_item.addChild(node)
+                self.roi_manager.register_rectangle(node, rect)
+                pattern_item.setExpanded(True)
             self.tree_manager.renumber_pattern_labels()
+        finally:
+            tree.setUpdatesEnabled(True)
+            tree.blockSignals(False)
+        if node is not None:
+            tree.setCurrentItem(node)
+            self.roi_manager.show_for_item(node)
 
     def _on_grid_dialog_finished(self, _result: int) -> None:
         self._grid_dialog = None
         if self._grid_preview_overlay is not None:
-            self._grid_preview_overlay.hide()
+            self._grid_preview_overlay.clear()
 
     def _reset_image_view(self) -> None:
         if self._current_image is None:
@@ -1648,12 +2252,31 @@ class StimDMDWidget(QWidget):
     def remember_calibration_file(self, path: str) -> None:
         """Store the path to the most recently used calibration file."""
         self._last_calibration_file_path = path
+        self._last_calibration_location = None
         self._preferences.set_last_calibration_file_path(path)
 
     def last_calibration_file_path(self) -> str:
         """Return the last calibration file recorded for this session."""
         return self._last_calibration_file_path
 
+    def _last_calibration_file_location(self) -> tuple[Path, bool, bool] | None:
+        """Return ``(path, exists, parent exists)`` for the last calibration file.
+
+        The filesystem is checked once per remembered path; it may sit on a
+        slow network share.
+        """
+        last_path = self.last_calibration_file_path()
+        if not last_path:
+            return None
+        cached = self._last_calibration_location
+        if cached is None or cached[0] != last_path:
+            candidate = Path(str(last_path)).expanduser()
+            exists = candidate.exists()
+            parent_exists = exists or candidate.parent.exists()
+            cached = (last_path, candidate, exists, parent_exists)
+            self._last_calibration_location = cached
+        return cached[1:]
+
     def _apply_auto_levels_full(self) -> None:
         self._apply_histogram_levels(percentile=None)
 
@@ -1661,38 +2284,81 @@ class StimDMDWidget(QWidget):
         self._apply_histogram_levels(percentile=(1.0, 99.0))
 
     def _apply_histogram_levels(
-        self, percentile: tuple[float, float] | None
+        self, percentile: tuple[float, float] | None, *, precise: bool = False
     ) -> None:
         if self._current_image is None:
             return
+        # Levels depend only on the frame; _set_image drops these per new frame.
+        cache_key = (percentile, precise)
+        levels = self._auto_levels_cache.get(cache_key)
+        if levels is None:
+            levels = self._compute_histogram_levels(percentile, precise=precise)
+            if levels is None:
+                return
+            self._auto_levels_cache[cache_key] = levels
+        try:
+            self._image_item.setLevels(levels)
+        except Exception:
+            pass
+        self._hist_widget.region.setRegion(levels)
+        self._current_levels = levels
+
+    def _compute_histogram_levels(
+        self, percentile: tuple[float, float] | None, *, precise: bool = False
+    ) -> tuple[float, float] | None:
+        """Return ``(lower, upper)`` levels for the current frame, or ``None``."""
         data = self._current_image
-        if data.ndim == 3:
-            # Collapse colour channels to pick global min/max.
-            data = data.reshape(-1, data.shape[2])
         try:
             if percentile is None:
-                lower = float(np.nanmin(data))
-                upper = float(np.nanmax(data))
+                if data.dtype.kind in "ui":
+                    # Integer frames can't hold NaN; plain reductions skip the
+                    # nan-aware wrappers and their isnan checks.
+                    lower = float(data.min())
+                    upper = float(data.max())
+                else:
+                    lower = float(np.nanmin(data))
+                    upper = float(np.nanmax(data))
             else:
                 low_p, high_p = percentile
-                finite = data[np.isfinite(data)]
-                if finite.size == 0:
-                    return
-                lower = float(np.nanpercentile(finite, low_p))
-                upper = float(np.nanpercentile(finite, high_p))
+                # Percentile levels don't need every pixel: unless ``precise``
+                # is requested, frames above the sample size are read on a
+                # regular 2-D grid (every ``step``-th row and column).
+                step = 1
+                if not precise:
+                    pixel_count = data.shape[0] * data.shape[1]
+                    step = max(1, math.isqrt(pixel_count // _LEVELS_SAMPLE_SIZE))
+                view = data[::step, ::step]
+                sample = view.reshape(view.shape[0] * view.shape[1], -1)
+                if sample.shape[1] == 1:
+                    low_values = high_values = sample[:, 0]
+                else:
+                    # Colour: darkest channel sets the floor, brightest the ceiling.
+                    low_values = sample.min(axis=1)
+                    high_values = sample.max(axis=1)
+                grayscale = high_values is low_values
+                if sample.dtype.kind == "f":
+                    low_values = _finite_values(low_values)
+                    high_values = (
+                        low_values if grayscale else _finite_values(high_values)
+                    )
+                if low_values.size == 0 or high_values.size == 0:
+                    return None
+                if grayscale and low_values.dtype.kind == "f":
+                    # One selection pass serves both bounds.
+                    lower, upper = (
+                        float(v) for v in np.percentile(low_values, (low_p, high_p))
+                    )
+                else:
+                    lower = _percentile_level(low_values, low_p)
+                    upper = _percentile_level(high_values, high_p)
         except Exception:
-            return
+            return None
         if not np.isfinite(lower) or not np.isfinite(upper) or upper <= lower:
-            return
-        levels = (lower, upper)
-        try:
-            self._image_item.setLevels(levels)
-        except Exception:
-            pass
-        self._hist_widget.region.setRegion(levels)
-        self._current_levels = levels
+            return None
+        return (lower, upper)
 
     def _reset_histogram_region(self) -> None:
+        self._flush_histogram_levels()
         levels = self._current_levels
         if levels is None:
             self._apply_auto_levels_full()
@@ -1708,18 +2374,30 @@ class StimDMDWidget(QWidget):
         auto_contrast: bool = False,
     ) -> None:
         """Display ``image`` and optionally adapt the view/contrast settings."""
+        source = image
         image = np.asarray(image)
         if image.ndim not in (2, 3):
             raise ValueError("Images must be 2D grayscale or 3-channel colour arrays.")
+        # Hand the renderer one C-ordered buffer in a dtype it maps directly,
+        # so it never has to walk strides or convert on its side. The native
+        # frame is what gets stored: calibration and saving need full precision.
+        image = np.ascontiguousarray(image)
+        display_image = (
+            image if image.dtype in _DISPLAY_DTYPES else image.astype(np.float32)
+        )
         height, width = image.shape[:2]
+        self._flush_histogram_levels()
         previous_levels = self._current_levels
+        # Callers displaying a file record its fingerprint after this returns.
+        self._image_file_fingerprint = None
+        self._auto_levels_cache.clear()
 
-        view_box = self._get_view_box()
-        preserve_view = (
-            not fit_to_view
-            and self._current_image is not None
+        view_box = self._view_box
+        same_geometry = (
+            self._current_image is not None
             and self._current_image.shape[:2] == image.shape[:2]
         )
+        preserve_view = not fit_to_view and same_geometry
         if preserve_view:
             try:
                 previous_range = view_box.viewRange()
@@ -1728,22 +2406,24 @@ class StimDMDWidget(QWidget):
         else:
             previous_range = None
 
-        # ImageView expects column-major data; transpose so axes remain aligned.
-        display_image = (
-            image.T if image.ndim == 2 else np.transpose(image, axes=(1, 0, 2))
-        )
         use_previous_levels = previous_levels is not None and not auto_contrast
         auto_levels_flag = not use_previous_levels
         levels = previous_levels if use_previous_levels else None
         self._image_item.setImage(
-            display_image,
+            self._display_array(display_image),
             autoLevels=auto_levels_flag,
-            autoDownsample=False,
             levels=levels,
         )
-        self._image_item.setRect(QRectF(0.0, 0.0, float(width), float(height)))
-        self._image_item.setPos(0.0, 0.0)
+        # The item's transform is managed by _update_image_transform(); its
+        # untransformed bounds are already the (0, 0, width, height) pixel grid.
         self._current_image = image
+        # np.asarray drops the memmap subclass; remember whether the stored
+        # frame is still a view of a mapped file.
+        self._current_image_mapped = isinstance(source, np.memmap) and (
+            np.may_share_memory(image, source)
+        )
+        if not same_geometry:
+            self._image_corners_camera = None
         if auto_contrast:
             self._apply_auto_levels_clipped()
         elif use_previous_levels and levels is not None:
@@ -1754,22 +2434,60 @@ class StimDMDWidget(QWidget):
             self._update_image_transform()
             self._update_axis_visuals()
         else:
-            self._image_item.setTransform(QTransform())
+            if self._image_transform_key is not None:
+                self._image_item.setTransform(self._IDENTITY_TRANSFORM)
+                self._image_transform_key = None
             for item in (
                 self._axis_line_item,
                 self._axis_arrow_item,
                 self._axis_origin_item,
             ):
                 item.hide()
+            self._axis_visuals_key = None
         self._update_zoom_constraints(width, height)
-        view_box.enableAutoRange(pg.ViewBox.XYAxes, enable=False)
+        # Both calls below notify/repaint even when nothing changes, so skip
+        # them for same-geometry frames that keep the current view.
+        if any(view_box.autoRangeEnabled()):
+            view_box.enableAutoRange(pg.ViewBox.XYAxes, enable=False)
         if preserve_view and previous_range is not None:
             x_range, y_range = previous_range
-            view_box.setRange(xRange=x_range, yRange=y_range, padding=0.0)
+            self._set_view_range(x_range, y_range)
         else:
             self._fit_view_to_image(use_axis=apply_axis and self._axis_defined)
 
+    def _display_array(self, image: np.ndarray):
+        """Return ``image`` as handed to the ImageItem (on the GPU if enabled)."""
+        if self._gpu_display:
+            try:
+                return cupy.asarray(image)
+            except Exception:
+                # No usable device (or out of memory): keep displaying from host.
+                self._apply_gpu_display(False)
+        return image
+
+    def _apply_gpu_display(self, enabled: bool) -> None:
+        """Switch GPU display and pyqtgraph's process-wide ``useCupy`` option."""
+        enabled = bool(enabled) and cupy is not None
+        if enabled == self._gpu_display:
+            return
+        self._gpu_display = enabled
+        pg.setConfigOptions(useCupy=True if enabled else self._saved_use_cupy)
+
+    def _on_gpu_display_toggled(self, enabled: bool) -> None:
+        self._preferences.set_gpu_display_enabled(enabled)
+        self._apply_gpu_display(enabled)
+        if self._current_image is not None:
+            # Re-submit the frame so the item holds a host or device array.
+            self._set_image(self._current_image)
+
+    def _flush_histogram_levels(self) -> None:
+        """Store levels from a region drag that has not settled yet."""
+        if self._levels_timer.isActive():
+            self._levels_timer.stop()
+            self._store_histogram_levels()
+
     def _store_histogram_levels(self) -> None:
+        self._levels_timer.stop()
         try:
             low, high = self._hist_widget.region.getRegion()
             self._current_levels = (float(low), float(high))
@@ -1797,8 +2515,9 @@ class StimDMDWidget(QWidget):
                 return
 
         try:
-            with Image.open(chosen_path) as pil_image:
-                image = np.array(pil_image)
+            # Not memory-mapped: the acquisition software may overwrite or
+            # delete this file while it is still on screen.
+            image = _read_image_file(chosen_path)
         except Exception as exc:
             QMessageBox.warning(
                 self,
@@ -1812,6 +2531,12 @@ class StimDMDWidget(QWidget):
             self.ui.lineEdit_image_folder_path.setText(directory)
 
         self._set_image(image, fit_to_view=True, auto_contrast=True)
+        try:
+            self._image_file_fingerprint = _file_fingerprint(
+                chosen_path, os.stat(chosen_path)
+            )
+        except OSError:
+            pass
 
     def _calibrate_dmd(self):
         action = self._prompt_calibration_action()
@@ -1852,16 +2577,14 @@ class StimDMDWidget(QWidget):
         return None
 
     def _load_calibration_from_dialog(self) -> None:
-        last_path = self.last_calibration_file_path()
+        location = self._last_calibration_file_location()
         initial = ""
-        if last_path:
-            candidate = Path(str(last_path)).expanduser()
-            if candidate.exists():
+        if location is not None:
+            candidate, exists, parent_exists = location
+            if exists:
                 initial = str(candidate)
-            else:
-                parent = candidate.parent
-                if parent.exists():
-                    initial = str(parent)
+            elif parent_exists:
+                initial = str(candidate.parent)
         file_filter = "Calibration files (*.h5 *.hdf5);;All files (*)"
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -1951,8 +2674,10 @@ class StimDMDWidget(QWidget):
         if not file_path:
             return
         try:
-            with Image.open(file_path) as pil_image:
-                calibration_image = np.array(pil_image)
+            # The calibration frame is only displayed and measured, so map it
+            # rather than decoding a copy; repeat calibrations are then served
+            # from the OS page cache.
+            calibration_image = _read_image_file(file_path, memory_map=True)
         except Exception as exc:
             QMessageBox.warning(
                 self,
@@ -1965,92 +2690,103 @@ class StimDMDWidget(QWidget):
         if selected_dir:
             self.ui.lineEdit_image_folder_path.setText(selected_dir)
 
-        previous_image = self._current_image
+        previous_image: np.ndarray | str | None = self._current_image
+        previous_mapped = self._current_image_mapped
         previous_view = self._capture_view_state()
         selected_items = self.ui.treeWidget.selectedItems()
         selected_item = selected_items[0] if selected_items else None
         self.roi_manager.clear_visible_only()
 
-        # Swap the display to the calibration image but remember the previous
-        # session so we can restore it if the workflow is cancelled mid-way.
-        self._set_image(
-            calibration_image,
-            fit_to_view=True,
-            apply_axis=False,
-            auto_contrast=True,
-        )
+        try:
+            # Swap the display to the calibration image. Whatever happens next
+            # (cancel, failure or an unexpected error), the finally clause restores
+            # the previous session and removes any spill file.
+            self._set_image(
+                calibration_image,
+                fit_to_view=True,
+                apply_axis=False,
+                auto_contrast=True,
+            )
+            if (
+                previous_image is not None
+                and not previous_mapped
+                and previous_image.nbytes > _SPILL_IMAGE_BYTES
+            ):
+                # Only this local still references the old frame now; park it on
+                # disk until _restore_after_calibration() reloads it.
+                spilled_path = _spill_image(previous_image)
+                if spilled_path is not None:
+                    previous_image = spilled_path
+
+            diagonal_points = self._prompt_calibration_diagonal()
+            if diagonal_points is None:
+                QMessageBox.information(
+                    self,
+                    "Calibration cancelled",
+                    "No calibration diagonal was drawn. Calibration has been cancelled.",
+                )
+                return
 
-        diagonal_points = self._prompt_calibration_diagonal()
-        if diagonal_points is None:
-            QMessageBox.information(
+            invert_defaults = self._preferences.axes_inverted()
+            default_invert_x = bool(invert_defaults[0])
+            default_invert_y = bool(invert_defaults[1])
+            default_mirrors = self._preferences.mirror_counts()
+            if action == "send":
+                default_mirrors = (int(square_size), int(square_size))
+            dialog = _CalibrationDialog(
                 self,
-                "Calibration cancelled",
-                "No calibration diagonal was drawn. Calibration has been cancelled.",
+                default_mirrors=default_mirrors,
+                default_pixel_size=self._preferences.pixel_size(),
+                default_invert_x=default_invert_x,
+                default_invert_y=default_invert_y,
             )
-            self._restore_after_calibration(previous_image, previous_view, selected_item)
-            return
+            if dialog.exec() != QDialog.DialogCode.Accepted:
+                return
 
-        invert_defaults = self._preferences.axes_inverted()
-        default_invert_x = bool(invert_defaults[0])
-        default_invert_y = bool(invert_defaults[1])
-        default_mirrors = self._preferences.mirror_counts()
-        if action == "send":
-            default_mirrors = (int(square_size), int(square_size))
-        dialog = _CalibrationDialog(
-            self,
-            default_mirrors=default_mirrors,
-            default_pixel_size=self._preferences.pixel_size(),
-            default_invert_x=default_invert_x,
-            default_invert_y=default_invert_y,
-        )
-        if dialog.exec() != QDialog.DialogCode.Accepted:
-            self._restore_after_calibration(previous_image, previous_view, selected_item)
-            return
+            square_mirrors, pixel_size, invert_x, invert_y = dialog.values()
+            self._preferences.set_mirror_counts(square_mirrors, square_mirrors)
+            self._preferences.set_pixel_size(pixel_size)
+            self._preferences.set_axes_inverted(invert_x, invert_y)
+            camera_shape = (
+                int(calibration_image.shape[1]),
+                int(calibration_image.shape[0]),
+            )
+            if self.dmd is not None and hasattr(self.dmd, "shape"):
+                try:
+                    dmd_shape = tuple(int(v) for v in self.dmd.shape)
+                except Exception:
+                    dmd_shape = (1024, 768)
+            else:
+                dmd_shape = (1024, 768)
 
-        square_mirrors, pixel_size, invert_x, invert_y = dialog.values()
-        self._preferences.set_mirror_counts(square_mirrors, square_mirrors)
-        self._preferences.set_pixel_size(pixel_size)
-        self._preferences.set_axes_inverted(invert_x, invert_y)
-        camera_shape = (
-            int(calibration_image.shape[1]),
-            int(calibration_image.shape[0]),
-        )
-        if self.dmd is not None and hasattr(self.dmd, "shape"):
             try:
-                dmd_shape = tuple(int(v) for v in self.dmd.shape)
-            except Exception:
-                dmd_shape = (1024, 768)
-        else:
-            dmd_shape = (1024, 768)
+                calibration = compute_calibration_from_square(
+                    diagonal_points,
+                    square_mirrors,
+                    pixel_size,
+                    camera_shape=camera_shape,
+                    dmd_shape=dmd_shape,
+                    invert_x=invert_x,
+                    invert_y=invert_y,
+                )
+            except ValueError as exc:
+                QMessageBox.warning(self, "Calibration failed", str(exc))
+                return
 
-        try:
-            calibration = compute_calibration_from_square(
-                diagonal_points,
-                square_mirrors,
-                pixel_size,
-                camera_shape=camera_shape,
-                dmd_shape=dmd_shape,
-                invert_x=invert_x,
-                invert_y=invert_y,
+            self.calibration = calibration
+            print(
+                "Updated DMD calibration: pixels/mirror=(%.3f, %.3f), µm/mirror=(%.3f, %.3f), rotation=%.2f°"
+                % (
+                    calibration.camera_pixels_per_mirror[0],
+                    calibration.camera_pixels_per_mirror[1],
+                    calibration.micrometers_per_mirror[0],
+                    calibration.micrometers_per_mirror[1],
+                    np.degrees(calibration.camera_rotation_rad),
+                )
             )
-        except ValueError as exc:
-            QMessageBox.warning(self, "Calibration failed", str(exc))
+            self._prompt_save_calibration(calibration)
+        finally:
             self._restore_after_calibration(previous_image, previous_view, selected_item)
-            return
-
-        self.calibration = calibration
-        print(
-            "Updated DMD calibration: pixels/mirror=(%.3f, %.3f), µm/mirror=(%.3f, %.3f), rotation=%.2f°"
-            % (
-                calibration.camera_pixels_per_mirror[0],
-                calibration.camera_pixels_per_mirror[1],
-                calibration.micrometers_per_mirror[0],
-                calibration.micrometers_per_mirror[1],
-                np.degrees(calibration.camera_rotation_rad),
-            )
-        )
-        self._prompt_save_calibration(calibration)
-        self._restore_after_calibration(previous_image, previous_view, selected_item)
 
     def _prompt_save_calibration(self, calibration: DMDCalibration) -> None:
         response = QMessageBox.question(
@@ -2062,16 +2798,14 @@ class StimDMDWidget(QWidget):
         )
         if response != QMessageBox.StandardButton.Yes:
             return
-        last_path = self.last_calibration_file_path()
+        location = self._last_calibration_file_location()
         initial = ""
-        if last_path:
-            candidate = Path(str(last_path)).expanduser()
-            if candidate.exists():
+        if location is not None:
+            candidate, exists, parent_exists = location
+            if exists:
                 initial = str(candidate)
-            else:
-                parent = candidate.parent
-                if parent.exists():
-                    initial = str(parent / candidate.name)
+            elif parent_exists:
+                initial = str(candidate.parent / candidate.name)
         file_filter = "Calibration files (*.h5 *.hdf5);;All files (*)"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -2168,10 +2902,13 @@ class StimDMDWidget(QWidget):
 
     def _restore_after_calibration(
         self,
-        previous_image: np.ndarray | None,
+        previous_image: np.ndarray | str | None,
         previous_view_range: tuple[tuple[float, float], tuple[float, float]] | None,
         selected_item: QTreeWidgetItem | None,
     ) -> None:
+        if isinstance(previous_image, str):
+            # Frame spilled to disk by _define_new_calibration().
+            previous_image = _unspill_image(previous_image)
         if previous_image is not None:
             self._set_image(previous_image, auto_contrast=True)
             if previous_view_range is not None:
@@ -2183,8 +2920,11 @@ class StimDMDWidget(QWidget):
                 )
         else:
             self._image_item.clear()
+            self._levels_timer.stop()
             self._current_levels = None
             self._current_image = None
+            self._current_image_mapped = False
+            self._image_corners_camera = None
 
         if selected_item is not None:
             self.roi_manager.show_for_item(selected_item)
@@ -2209,17 +2949,34 @@ class StimDMDWidget(QWidget):
         if not os.path.exists(folder_path):
             print(f"Le dossier '{folder_path}' n'existe pas.")
             return
-        images = (
-            glob.glob(os.path.join(folder_path, "*.[pP][nN][gG]"))
-            + glob.glob(os.path.join(folder_path, "*.[jJ][pP][eE]?[gG]"))
-            + glob.glob(os.path.join(folder_path, "*.[gG][iI][fF]"))
-            + glob.glob(os.path.join(folder_path, "*.[tT][iI][iI]?[fF]"))
-        )
-        if not images:
+        # One scandir pass: DirEntry caches the stat, so each file costs a
+        # single syscall instead of one per glob plus one for getmtime.
+        last_image = None
+        last_stat = None
+        last_mtime = -math.inf
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() not in _IMAGE_SUFFIXES:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if stat.st_mtime > last_mtime:
+                    last_mtime = stat.st_mtime
+                    last_image = entry.path
+                    last_stat = stat
+        if last_image is None:
             return
-        last_image = max(images, key=os.path.getmtime)
-        image = np.array(Image.open(last_image))
+        fingerprint = _file_fingerprint(last_image, last_stat)
+        if fingerprint == self._image_file_fingerprint:
+            # Newest frame is already on screen; skip the decode and upload.
+            return
+        image = _read_image_file(last_image)
         self._set_image(image, fit_to_view=True, auto_contrast=True)
+        self._image_file_fingerprint = fingerprint
 
     def _show_grid(self):
         show = self.ui.pushButton_show_grid.isChecked()
@@ -2245,7 +3002,7 @@ class StimDMDWidget(QWidget):
         if np.linalg.norm(vector_axis) < 1e-6:
             return
         origin_camera = self._axis_to_camera(origin_axis)
-        direction_camera = self._rotation_matrix() @ vector_axis
+        direction_camera = self._axis_R_a2c @ vector_axis
         angle_camera = float(np.arctan2(direction_camera[1], direction_camera[0]))
         shapes_export = {
             item: (np.asarray(points, dtype=float), shape_type)
@@ -2274,43 +3031,27 @@ class StimDMDWidget(QWidget):
         print("Loaded empty PatternSequence")
 
     def _read_table_ms(self):
-        timings, durations, sequence = [], [], []
-        rows = self.ui.tableWidget.rowCount()
-        for r in range(rows):
-            t_item = self.ui.tableWidget.item(r, 0)
-            d_item = self.ui.tableWidget.item(r, 1)
-            s_item = self.ui.tableWidget.item(r, 2)
-            try:
-                if t_item and s_item:
-                    t_text = (t_item.text() or "").strip()
-                    s_text = (s_item.text() or "").strip()
-                    if not t_text or not s_text:
-                        continue
-                    d_text = (d_item.text() if d_item else "") or ""
-                    d_text = d_text.strip()
-                    t = int(t_text)
-                    d = int(d_text) if d_text else 0
-                    s = int(s_text)
-                    timings.append(t)
-                    durations.append(d)
-                    sequence.append(s)
-            except Exception:
-                continue
-        return timings, durations, sequence
+        rows = self.table_manager.sequence_rows()
+        return rows[:, 0].tolist(), rows[:, 1].tolist(), rows[:, 2].tolist()
 
     def _write_table_ms(self, model: PatternSequence):
-        t_ms = model.timings_milliseconds
-        d_ms = model.durations_milliseconds
-        seq = model.sequence
+        table = self.ui.tableWidget
+        # Format the numeric columns up front so the row loop only creates items.
+        columns = np.empty((2, len(model.sequence)), dtype=np.int64)
+        columns[0] = model.timings_milliseconds
+        columns[1] = model.durations_milliseconds
+        t_texts, d_texts = columns.astype(str).tolist()
+        pattern_indices = [int(s) for s in model.sequence]
         self._updating_table = True
-        self.table_manager.ensure_desc_column()
-        self.ui.tableWidget.setRowCount(len(seq))
-        for r, (t, d, s) in enumerate(zip(t_ms, d_ms, seq)):
-            self.ui.tableWidget.setItem(r, 0, QTableWidgetItem(str(int(t))))
-            self.ui.tableWidget.setItem(r, 1, QTableWidgetItem(str(int(d))))
-            self.ui.tableWidget.setItem(r, 2, QTableWidgetItem(str(int(s))))
-            self.table_manager.set_sequence_row_description(r, int(s))
-        self._updating_table = False
+        signals_were_blocked = table.blockSignals(True)
+        table.setUpdatesEnabled(False)
+        try:
+            self.table_manager.fill_sequence_rows(t_texts, d_texts, pattern_indices)
+        finally:
+            table.setUpdatesEnabled(True)
+            table.blockSignals(signals_were_blocked)
+            self._updating_table = False
+        table.viewport().update()
 
     def _load_patterns_file(self):
         initial = self.ui.lineEdit_file_path.text().strip()
@@ -2492,7 +3233,7 @@ class StimDMDWidget(QWidget):
                         )
                     else:
                         global_um = points
-                    camera_points = calibration.micrometre_to_camera(global_um.T).T
+                    camera_points = calibration.micrometre_points_to_camera(global_um)
                     dataset = pattern_grp.create_dataset(
                         f"polygon_{poly_index}", data=camera_points
                     )
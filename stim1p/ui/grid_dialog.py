@@ -20,6 +20,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ..logic.geometry import rectangle_corners
+
 
 @dataclass(slots=True)
 class GridParameters:
@@ -46,38 +48,34 @@ class GridParameters:
     def rectangle_points(self) -> list[np.ndarray]:
         """Return rectangle corner arrays in axis coordinates."""
 
+        return list(self.rectangle_corners())
+
+    def rectangle_corners(self) -> np.ndarray:
+        """Return all rectangle corners as one ``(rows * columns, 4, 2)`` array.
+
+        Rectangles are ordered row by row; an invalid grid yields an empty array.
+        """
+
         if not self.is_valid():
-            return []
-        rows = int(self.rows)
-        cols = int(self.columns)
+            return np.empty((0, 4, 2), dtype=float)
         width = float(self.rect_width)
         height = float(self.rect_height)
-        spacing_x = float(self.spacing_x)
-        spacing_y = float(self.spacing_y)
         angle_rad = math.radians(float(self.angle_deg))
         origin = np.array([float(self.origin_x), float(self.origin_y)], dtype=float)
         cos_a = math.cos(angle_rad)
         sin_a = math.sin(angle_rad)
-        rot = np.array([[cos_a, -sin_a], [sin_a, cos_a]], dtype=float)
-        step_x = rot @ np.array([width + spacing_x, 0.0])
-        step_y = rot @ np.array([0.0, height + spacing_y])
-        half_x = rot @ np.array([0.5 * width, 0.0])
-        half_y = rot @ np.array([0.0, 0.5 * height])
-        rectangles: list[np.ndarray] = []
-        for row in range(rows):
-            for col in range(cols):
-                centre = origin + col * step_x + row * step_y
-                corners = np.array(
-                    [
-                        centre - half_x - half_y,
-                        centre + half_x - half_y,
-                        centre + half_x + half_y,
-                        centre - half_x + half_y,
-                    ],
-                    dtype=float,
-                )
-                rectangles.append(corners)
-        return rectangles
+        # Rows are the rotated grid x and y directions.
+        basis = np.array([[cos_a, sin_a], [-sin_a, cos_a]], dtype=float)
+        steps = np.array(
+            [width + float(self.spacing_x), height + float(self.spacing_y)], dtype=float
+        )
+        cols, rows = np.meshgrid(
+            np.arange(int(self.columns), dtype=float),
+            np.arange(int(self.rows), dtype=float),
+        )
+        cell_index = np.stack((cols.ravel(), rows.ravel()), axis=1)
+        centres = origin + (cell_index * steps) @ basis
+        return rectangle_corners(centres, width, height, angle_rad)
 
 
 class GridDialog(QDialog):
@@ -6,6 +6,7 @@ associated with tree items in a Qt application.
 """
 
 from __future__ import annotations
+from contextlib import contextmanager
 from typing import Iterable
 
 import math
@@ -29,6 +30,10 @@ class _BaseShape:
         raise NotImplementedError
 
     def get_points(self) -> np.ndarray:
+        """Return a fresh C-contiguous ``(N, 2)`` float64 array of the vertices.
+
+        Callers may use (and modify) the result without converting or copying it.
+        """
         raise NotImplementedError
 
     def set_points(self, points: np.ndarray) -> None:
@@ -63,8 +68,8 @@ class PolygonShape(_BaseShape):
                 mapped += QPointF(float(roi_pos.x()), float(roi_pos.y()))
             points.append([float(mapped.x()), float(mapped.y())])
         if not points:
-            return np.zeros((0, 2), dtype=float)
-        return np.asarray(points, dtype=float)
+            return np.zeros((0, 2), dtype=np.float64)
+        return np.array(points, dtype=np.float64)
 
     def set_points(self, points: np.ndarray) -> None:
         from PySide6.QtCore import QPointF
@@ -95,21 +100,20 @@ class RectangleShape(_BaseShape):
         width = float(state.get("size", (0.0, 0.0))[0])
         height = float(state.get("size", (0.0, 0.0))[1])
         angle_deg = float(state.get("angle", 0.0))
-        center_vec = np.array([float(center.x()), float(center.y())], dtype=float)
-        half_size = np.array([width / 2.0, height / 2.0], dtype=float)
         angle_rad = math.radians(angle_deg)
-        rot = np.array(
-            [[math.cos(angle_rad), -math.sin(angle_rad)],
-             [math.sin(angle_rad), math.cos(angle_rad)]],
-            dtype=float,
-        )
-        pos = center_vec - rot @ half_size
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
+        half_w = 0.5 * width
+        half_h = 0.5 * height
+        pos_x = float(center.x()) - (cos_a * half_w - sin_a * half_h)
+        pos_y = float(center.y()) - (sin_a * half_w + cos_a * half_h)
         self.roi.setAngle(angle_deg)
-        self.roi.setPos(float(pos[0]), float(pos[1]))
+        self.roi.setPos(pos_x, pos_y)
 
     def get_points(self) -> np.ndarray:
         state = dict(self.roi.state)
-        pos = np.asarray(state.get("pos", (0.0, 0.0)), dtype=float)
+        pos = state.get("pos", (0.0, 0.0))
+        x0, y0 = float(pos[0]), float(pos[1])
         width, height = state.get("size", (0.0, 0.0))
         width = float(width)
         height = float(height)
@@ -117,13 +121,16 @@ class RectangleShape(_BaseShape):
         angle_rad = math.radians(angle_deg)
         cos_a = math.cos(angle_rad)
         sin_a = math.sin(angle_rad)
-        u = np.array([cos_a, sin_a], dtype=float)
-        v = np.array([-sin_a, cos_a], dtype=float)
-        p0 = pos
-        p1 = pos + width * u
-        p2 = p1 + height * v
-        p3 = pos + height * v
-        return np.asarray([p0, p1, p2, p3], dtype=float)
+        # Width runs along (cos, sin), height along (-sin, cos); four corners
+        # don't warrant temporary vectors.
+        wx, wy = width * cos_a, width * sin_a
+        hx, hy = -height * sin_a, height * cos_a
+        points = np.empty((4, 2), dtype=np.float64)
+        points[0] = (x0, y0)
+        points[1] = (x0 + wx, y0 + wy)
+        points[2] = (x0 + wx + hx, y0 + wy + hy)
+        points[3] = (x0 + hx, y0 + hy)
+        return points
 
     def set_points(self, points: np.ndarray) -> None:
         pts = np.asarray(points, dtype=float)
@@ -176,37 +183,62 @@ class RoiManager(QObject):
 
     visibilityChanged = Signal()
     shapeEdited = Signal(QTreeWidgetItem)
+    # Emitted once at the end of bulk_update() with every item updated inside it.
+    shapesBulkEdited = Signal(list)
+
+    _INITIAL_POOL_SIZE = 256
 
     def __init__(self, image_view: pg.GraphicsItem):
         super().__init__()
         self._image_view = image_view
         self._shapes: dict[QTreeWidgetItem, _BaseShape] = {}
         self._visible_rois: list[pg.ROI] = []
+        # Packed copy of every shape's points: item -> (start, stop, shape_type)
+        # rows of ``_points_pool``. Reading ROI handles goes through Qt for every
+        # vertex, so exports read these slices instead and only shapes whose ROI
+        # changed since the last read are re-synchronised.
+        self._points_pool = np.empty((self._INITIAL_POOL_SIZE, 2), dtype=np.float64)
+        self._pool_used = 0
+        self._slots: dict[QTreeWidgetItem, tuple[int, int, str]] = {}
+        self._stale_slots: set[QTreeWidgetItem] = set()
+        self.shapeEdited.connect(self._stale_slots.add)
+        self._bulk_depth = 0
+        self._bulk_edited: list[QTreeWidgetItem] = []
 
     # ---- Ownership / registration ----------------------------------------
     def register_polygon(self, item: QTreeWidgetItem, points: np.ndarray) -> PolygonShape:
-        polygon = PolygonShape(points.astype("float64"), item)
-        polygon.roi.sigRegionChangeFinished.connect(
-            lambda *_: self.shapeEdited.emit(item)
-        )
-        self._image_view.addItem(polygon.roi)
-        polygon.roi.setVisible(False)
-        self._shapes[item] = polygon
+        pts = np.ascontiguousarray(points, dtype=np.float64)
+        polygon = PolygonShape(pts, item)
+        # Handles sit exactly on the given vertices, so store them without
+        # reading the ROI back.
+        self._attach_shape(item, polygon, pts)
         return polygon
 
     def register_rectangle(
         self, item: QTreeWidgetItem, points: np.ndarray
     ) -> RectangleShape:
-        rectangle = RectangleShape(points.astype("float64"), item)
-        rectangle.roi.sigRegionChangeFinished.connect(
+        rectangle = RectangleShape(np.ascontiguousarray(points, dtype=np.float64), item)
+        self._attach_shape(item, rectangle)
+        return rectangle
+
+    def _attach_shape(
+        self,
+        item: QTreeWidgetItem,
+        shape: _BaseShape,
+        points: np.ndarray | None = None,
+    ) -> None:
+        shape.roi.sigRegionChangeFinished.connect(
             lambda *_: self.shapeEdited.emit(item)
         )
-        self._image_view.addItem(rectangle.roi)
-        rectangle.roi.setVisible(False)
-        self._shapes[item] = rectangle
-        return rectangle
+        shape.roi.sigRegionChanged.connect(lambda *_: self._stale_slots.add(item))
+        self._image_view.addItem(shape.roi)
+        shape.roi.setVisible(False)
+        self._shapes[item] = shape
+        self._store_points(item, shape, points)
 
     def unregister_item(self, item: QTreeWidgetItem) -> None:
+        self._slots.pop(item, None)
+        self._stale_slots.discard(item)
         shape = self._shapes.pop(item, None)
         if shape is None:
             return
@@ -222,6 +254,9 @@ class RoiManager(QObject):
         for shape in self._shapes.values():
             self._image_view.removeItem(shape.roi)
         self._shapes.clear()
+        self._slots.clear()
+        self._stale_slots.clear()
+        self._pool_used = 0
         self.visibilityChanged.emit()
 
     # ---- View control -----------------------------------------------------
@@ -275,6 +310,72 @@ class RoiManager(QObject):
             for item, shape in self._shapes.items()
         }
 
+    def shape_points(self, item: QTreeWidgetItem) -> np.ndarray | None:
+        """Return a read-only view of the points stored for ``item``."""
+
+        if item in self._stale_slots:
+            shape = self._shapes.get(item)
+            if shape is not None:
+                self._store_points(item, shape)
+            self._stale_slots.discard(item)
+        slot = self._slots.get(item)
+        if slot is None:
+            return None
+        start, stop, _shape_type = slot
+        view = self._points_pool[start:stop]
+        view.flags.writeable = False
+        return view
+
+    # ---- Packed point storage ---------------------------------------------
+    def _store_points(
+        self,
+        item: QTreeWidgetItem,
+        shape: _BaseShape,
+        points: np.ndarray | None = None,
+    ) -> None:
+        if points is None:
+            points = shape.get_points()
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        count = points.shape[0]
+        slot = self._slots.get(item)
+        if slot is not None and slot[1] - slot[0] == count:
+            start = slot[0]
+        else:
+            start = self._reserve_rows(count)
+        self._points_pool[start : start + count] = points
+        self._slots[item] = (start, start + count, shape.shape_type)
+
+    def _reserve_rows(self, count: int) -> int:
+        if self._pool_used + count > self._points_pool.shape[0]:
+            self._compact_pool(extra=count)
+        start = self._pool_used
+        self._pool_used += count
+        return start
+
+    def _compact_pool(self, extra: int = 0) -> None:
+        """Drop rows left behind by removed or resized shapes.
+
+        Live rows are copied into a freshly allocated pool (grown so ``extra``
+        more rows fit): views already returned by :meth:`shape_points` keep
+        pointing at the old buffer and stay valid.
+        """
+
+        live = sum(stop - start for start, stop, _shape_type in self._slots.values())
+        capacity = self._points_pool.shape[0]
+        while capacity < live + extra:
+            capacity *= 2
+        pool = np.empty((capacity, 2), dtype=np.float64)
+        cursor = 0
+        for item, (start, stop, shape_type) in sorted(
+            self._slots.items(), key=lambda entry: entry[1][0]
+        ):
+            count = stop - start
+            pool[cursor : cursor + count] = self._points_pool[start:stop]
+            self._slots[item] = (cursor, cursor + count, shape_type)
+            cursor += count
+        self._points_pool = pool
+        self._pool_used = cursor
+
     def update_shape(
         self, item: QTreeWidgetItem, shape_type: str, points: np.ndarray
     ) -> None:
@@ -291,4 +392,26 @@ class RoiManager(QObject):
             new_shape = self.register_polygon(item, points)
         if was_visible:
             self._add_visible(new_shape.roi)
-        self.shapeEdited.emit(item)
+        if self._bulk_depth:
+            self._bulk_edited.append(item)
+        else:
+            self.shapeEdited.emit(item)
+
+    @contextmanager
+    def bulk_update(self):
+        """Collect update_shape() notifications into one shapesBulkEdited emit."""
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0 and self._bulk_edited:
+                edited, self._bulk_edited = self._bulk_edited, []
+                self.shapesBulkEdited.emit(edited)
+
+    def update_shapes_bulk(
+        self, updates: Iterable[tuple[QTreeWidgetItem, str, np.ndarray]]
+    ) -> None:
+        with self.bulk_update():
+            for item, shape_type, points in updates:
+                self.update_shape(item, shape_type, points)
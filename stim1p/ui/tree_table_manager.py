@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+import numpy as np
+from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtGui import QGuiApplication, QKeySequence
 from PySide6.QtWidgets import (
     QTreeWidgetItem,
@@ -34,6 +35,36 @@ class TreeManager:
     def __init__(self, widget: StimDMDWidget):
         self.widget = widget
         self._next_pattern_id = 0
+        # Python-side mirror of the tree's pattern/shape structure, rebuilt
+        # lazily after any structural change (including drag-and-drop moves).
+        self._structure: list[tuple[QTreeWidgetItem, list[QTreeWidgetItem]]] | None = None
+        tree_model = widget.ui.treeWidget.model()
+        for signal in (
+            tree_model.rowsInserted,
+            tree_model.rowsRemoved,
+            tree_model.rowsMoved,
+            tree_model.layoutChanged,
+            tree_model.modelReset,
+        ):
+            signal.connect(self._invalidate_structure)
+
+    def _invalidate_structure(self, *_args) -> None:
+        self._structure = None
+
+    def pattern_structure(self) -> list[tuple[QTreeWidgetItem, list[QTreeWidgetItem]]]:
+        """Get ``(pattern_item, shape_items)`` pairs in tree order."""
+        if self._structure is None:
+            tree = self.widget.ui.treeWidget
+            structure = []
+            for i in range(tree.topLevelItemCount()):
+                pattern_item = _assert_not_None(tree.topLevelItem(i))
+                children = [
+                    _assert_not_None(pattern_item.child(j))
+                    for j in range(pattern_item.childCount())
+                ]
+                structure.append((pattern_item, children))
+            self._structure = structure
+        return self._structure
 
     def new_pattern_id(self) -> int:
         """Generate a new pattern ID."""
@@ -52,11 +83,7 @@ class TreeManager:
 
     def pattern_id_order(self) -> list[int]:
         """Get pattern IDs in order."""
-        items = [
-            _assert_not_None(self.widget.ui.treeWidget.topLevelItem(i))
-            for i in range(self.widget.ui.treeWidget.topLevelItemCount())
-        ]
-        return [self.pattern_id(item) for item in items]
+        return [self.pattern_id(item) for item, _children in self.pattern_structure()]
 
     def set_pattern_label(self, item: QTreeWidgetItem, index: int, desc: str) -> None:
         """Set the label for a pattern item."""
@@ -234,6 +261,60 @@ class TableManager:
         self._paste_shortcut = QShortcut(QKeySequence.StandardKey.Paste, table)
         self._paste_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
         self._paste_shortcut.activated.connect(self.paste_clipboard)
+        # Parsed (timing, duration, pattern index) rows, rebuilt lazily after
+        # any edit to the first three columns or to the table's row layout.
+        self._sequence_rows: np.ndarray | None = None
+        table_model = table.model()
+        table_model.dataChanged.connect(self._on_table_data_changed)
+        for signal in (
+            table_model.rowsInserted,
+            table_model.rowsRemoved,
+            table_model.rowsMoved,
+            table_model.layoutChanged,
+            table_model.modelReset,
+        ):
+            signal.connect(self._invalidate_sequence_rows)
+
+    def _invalidate_sequence_rows(self, *_args) -> None:
+        self._sequence_rows = None
+
+    def _on_table_data_changed(
+        self, top_left: QModelIndex, _bottom_right: QModelIndex, *_args
+    ) -> None:
+        # Description updates (column 3) don't affect the parsed sequence.
+        if top_left.column() <= 2:
+            self._sequence_rows = None
+
+    def sequence_rows(self) -> np.ndarray:
+        """Get the valid sequence rows as an ``(N, 3)`` int64 array.
+
+        Columns are timing (ms), duration (ms) and pattern index. Rows with a
+        missing or non-integer timing/index are skipped; an empty duration
+        counts as 0.
+        """
+        if self._sequence_rows is None:
+            table = self.widget.ui.tableWidget
+            rows: list[tuple[int, int, int]] = []
+            for r in range(table.rowCount()):
+                t_item = table.item(r, 0)
+                d_item = table.item(r, 1)
+                s_item = table.item(r, 2)
+                try:
+                    if t_item and s_item:
+                        t_text = (t_item.text() or "").strip()
+                        s_text = (s_item.text() or "").strip()
+                        if not t_text or not s_text:
+                            continue
+                        d_text = (d_item.text() if d_item else "") or ""
+                        d_text = d_text.strip()
+                        t = int(t_text)
+                        d = int(d_text) if d_text else 0
+                        s = int(s_text)
+                        rows.append((t, d, s))
+                except Exception:
+                    continue
+            self._sequence_rows = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        return self._sequence_rows
 
     def ensure_desc_column(self):
         """Ensure the description column exists in the table."""
@@ -290,6 +371,32 @@ class TableManager:
         it.setText(desc)
         it.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
 
+    def fill_sequence_rows(
+        self, timings: list[str], durations: list[str], pattern_indices: list[int]
+    ) -> None:
+        """Replace the table rows with pre-formatted timing/duration cells.
+
+        Each distinct pattern description is looked up once, and every cell is
+        created fresh, so the loop makes no per-row lookups into the tree or
+        the table. Callers handle signal blocking and repaint batching.
+        """
+
+        self.ensure_desc_column()
+        table = self.widget.ui.tableWidget
+        describe = self.widget.tree_manager.pattern_description_by_index
+        descriptions = {idx: describe(idx) for idx in set(pattern_indices)}
+        read_only = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        table.setRowCount(len(pattern_indices))
+        for r, (t_text, d_text, idx) in enumerate(
+            zip(timings, durations, pattern_indices)
+        ):
+            table.setItem(r, 0, QTableWidgetItem(t_text))
+            table.setItem(r, 1, QTableWidgetItem(d_text))
+            table.setItem(r, 2, QTableWidgetItem(str(idx)))
+            desc_item = QTableWidgetItem(descriptions[idx])
+            desc_item.setFlags(read_only)
+            table.setItem(r, 3, desc_item)
+
     def refresh_sequence_descriptions(self):
         self._updating_table = True
         rows = self.widget.ui.tableWidget.rowCount()
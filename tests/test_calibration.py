@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import numpy as np
+
+from stim1p.logic.calibration import DMDCalibration
+
+
+def test_point_helpers_match_coordinate_helpers():
+    calibration = DMDCalibration(
+        camera_origin_pixels=(12.0, -4.0),
+        camera_pixels_per_mirror=(1.5, 1.25),
+        camera_rotation_rad=0.3,
+        micrometers_per_mirror=(2.0, 2.5),
+    )
+    points = np.array([[0.0, 0.0], [10.0, 3.0], [-7.5, 42.0]])
+
+    micrometres = calibration.camera_points_to_micrometre(points)
+
+    np.testing.assert_allclose(
+        micrometres, calibration.camera_to_micrometre(points.T).T
+    )
+    np.testing.assert_allclose(
+        calibration.micrometre_points_to_camera(micrometres), points
+    )
+    np.testing.assert_allclose(
+        calibration.camera_points_to_micrometre(points[1]), micrometres[1:2]
+    )
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import os
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 
 pytest.importorskip("PySide6")
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtWidgets import QApplication, QTreeWidgetItem
 
+from stim1p.logic.calibration import DMDCalibration
 from stim1p.logic.sequence import PatternSequence
 from stim1p.ui import dmd_stim_widget
+from stim1p.ui.roi_manager import RectangleShape
 
 
 class _DummyStim1P:
@@ -194,3 +201,1068 @@ def test_run_now_button_starts_and_stops_sequence(widget, monkeypatch):
     assert not stim.is_running
     assert stim_widget.ui.pushButton_run_now.text() == "Start run now"
     assert not messages
+
+
+def test_grid_preview_overlay_draws_all_rectangles_in_one_curve(widget):
+    stim_widget, _stim = widget
+    overlay = stim_widget._ensure_grid_preview_overlay()
+    square = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+
+    overlay.set_rectangles([square, square + 5.0, square + 10.0])
+
+    curves = [
+        item
+        for item in stim_widget._plot_item.items
+        if isinstance(item, dmd_stim_widget.pg.PlotCurveItem)
+    ]
+    assert len(curves) == 1
+    xs, ys = curves[0].getData()
+    assert xs.shape == (15,)
+    connect = curves[0].opts["connect"]
+    assert not connect[4] and not connect[9] and not connect[14]
+    assert connect[:4].all()
+    np.testing.assert_allclose(ys[5:10], [5.0, 5.0, 6.0, 6.0, 5.0])
+
+
+def test_roi_manager_packs_points_and_tracks_edits(widget):
+    stim_widget, _stim = widget
+    manager = stim_widget.roi_manager
+    first, second = QTreeWidgetItem(), QTreeWidgetItem()
+    triangle = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    square = np.array([[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 5.0]])
+    manager.register_polygon(first, triangle)
+    manager.register_rectangle(second, square)
+
+    np.testing.assert_allclose(manager.shape_points(first), triangle)
+    np.testing.assert_allclose(manager.shape_points(second), square)
+
+    moved = triangle + 3.0
+    manager.get_shape(first).set_points(moved)
+    np.testing.assert_allclose(manager.shape_points(first), moved)
+
+    manager.unregister_item(first)
+    assert manager.shape_points(first) is None
+    np.testing.assert_allclose(manager.shape_points(second), square)
+
+
+def test_axis_camera_round_trip(widget):
+    stim_widget, _stim = widget
+    origin = np.array([12.0, -4.0])
+    angle = 0.3
+    points = np.array([[0.0, 0.0], [3.0, 1.0], [-2.5, 7.0], [10.0, 10.0]])
+
+    axis = stim_widget._camera_to_axis(points, origin=origin, angle=angle)
+    rotation = stim_widget._rotation_matrix(angle)
+    np.testing.assert_allclose(axis, (rotation.T @ (points - origin).T).T)
+    np.testing.assert_allclose(
+        stim_widget._axis_to_camera(axis, origin=origin, angle=angle),
+        points,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        stim_widget._camera_to_axis(points[1], origin=origin, angle=angle), axis[1]
+    )
+
+
+def test_grid_preview_overlay_reuses_released_curve(widget):
+    stim_widget, _stim = widget
+    square = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    first = dmd_stim_widget._GridPreviewOverlay(stim_widget._plot_item)
+    first.set_rectangles([square])
+    curve = first._curve
+    first.clear()
+
+    second = dmd_stim_widget._GridPreviewOverlay(stim_widget._plot_item)
+    second.set_rectangles([square + 2.0])
+    assert second._curve is curve
+    assert curve in stim_widget._plot_item.items
+    second.clear()
+
+
+def test_batched_visual_updates_run_once_on_exit(widget, monkeypatch):
+    stim_widget, _stim = widget
+    transforms: list[object] = []
+    monkeypatch.setattr(stim_widget._image_item, "setTransform", transforms.append)
+
+    with stim_widget._batched_visual_updates():
+        with stim_widget._batched_visual_updates():
+            stim_widget._set_axis_state(np.array([3.0, 1.0]), 0.4, True)
+        stim_widget._update_image_transform()
+        assert transforms == []
+
+    assert len(transforms) == 1
+
+
+def test_new_frames_keep_an_unchanged_image_transform(widget, monkeypatch):
+    stim_widget, _stim = widget
+    stim_widget._set_axis_state(np.array([3.0, 1.0]), 0.4, True)
+    stim_widget._set_image(np.zeros((6, 8), dtype=np.uint8))
+    applied = stim_widget._image_item.transform()
+    transforms: list[object] = []
+    monkeypatch.setattr(stim_widget._image_item, "setTransform", transforms.append)
+
+    stim_widget._set_image(np.ones((6, 8), dtype=np.uint8))
+    assert transforms == []
+    assert stim_widget._image_item.transform() == applied
+
+    stim_widget._set_axis_state(np.array([3.0, 1.0]), 0.5, True)
+    assert len(transforms) == 1
+
+
+@pytest.mark.parametrize("quarter_turns", [0, 1, 2, 3, -1])
+def test_right_angle_conversions_match_general_rotation(widget, quarter_turns):
+    stim_widget, _stim = widget
+    origin = np.array([4.0, -9.0])
+    angle = quarter_turns * np.pi / 2.0
+    points = np.array([[0.0, 0.0], [3.0, 1.0], [-2.5, 7.0]])
+    rotation = np.array(
+        [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    )
+
+    axis = stim_widget._camera_to_axis(points, origin=origin, angle=angle)
+    np.testing.assert_allclose(axis, (points - origin) @ rotation, atol=1e-12)
+    np.testing.assert_allclose(
+        stim_widget._axis_to_camera(axis, origin=origin, angle=angle),
+        points,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        stim_widget._camera_to_axis(points[1], origin=origin, angle=angle),
+        axis[1],
+        atol=1e-12,
+    )
+
+
+def test_pattern_structure_follows_tree_changes(widget):
+    stim_widget, _stim = widget
+    tree = stim_widget.ui.treeWidget
+    manager = stim_widget.tree_manager
+    first, second = QTreeWidgetItem(["#0"]), QTreeWidgetItem(["#1"])
+    tree.addTopLevelItem(first)
+    tree.addTopLevelItem(second)
+    assert manager.pattern_structure() == [(first, []), (second, [])]
+
+    child = QTreeWidgetItem(["polygon"])
+    second.addChild(child)
+    assert manager.pattern_structure() == [(first, []), (second, [child])]
+
+    tree.takeTopLevelItem(0)
+    assert manager.pattern_structure() == [(second, [child])]
+    tree.clear()
+    assert manager.pattern_structure() == []
+
+
+def test_reproject_shapes_from_cache_matches_per_point_conversion(widget):
+    stim_widget, _stim = widget
+    triangle = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    square = np.array([[1.0, 1.0], [4.0, 1.0], [4.0, 4.0], [1.0, 4.0]])
+    first, second = QTreeWidgetItem(), QTreeWidgetItem()
+    stim_widget.roi_manager.register_polygon(first, triangle)
+    stim_widget.roi_manager.register_polygon(second, square)
+    cache = dmd_stim_widget._AxisRedefinitionCache(
+        previous_origin=np.array([5.0, -2.0]),
+        previous_angle=0.4,
+        new_origin=np.array([-3.0, 8.0]),
+        new_angle=-1.1,
+        shapes={first: (triangle, "polygon"), second: (square, "polygon")},
+    )
+
+    stim_widget._reproject_shapes_from_cache(cache)
+
+    for item, points in ((first, triangle), (second, square)):
+        camera = stim_widget._axis_to_camera(
+            points, origin=cache.previous_origin, angle=cache.previous_angle
+        )
+        expected = stim_widget._camera_to_axis(
+            camera, origin=cache.new_origin, angle=cache.new_angle
+        )
+        np.testing.assert_allclose(
+            stim_widget.roi_manager.shape_points(item), expected, atol=1e-9
+        )
+
+
+def test_clipped_auto_levels_ignore_non_finite_pixels(widget):
+    stim_widget, _stim = widget
+    image = np.linspace(0.0, 100.0, 64 * 64).reshape(64, 64)
+    image[0, :4] = np.nan
+    stim_widget._set_image(image)
+
+    stim_widget._apply_auto_levels_clipped()
+
+    lower, upper = stim_widget._current_levels
+    finite = image[np.isfinite(image)]
+    assert lower == pytest.approx(np.percentile(finite, 1.0))
+    assert upper == pytest.approx(np.percentile(finite, 99.0))
+
+
+def test_clipped_auto_levels_use_channel_extremes_for_colour(widget):
+    stim_widget, _stim = widget
+    base = np.linspace(0.0, 100.0, 32 * 32).reshape(32, 32)
+    image = np.stack([base, base + 10.0, base + 20.0], axis=2)
+    stim_widget._set_image(image)
+
+    stim_widget._apply_auto_levels_clipped()
+
+    lower, upper = stim_widget._current_levels
+    assert lower == pytest.approx(np.percentile(base, 1.0))
+    assert upper == pytest.approx(np.percentile(base + 20.0, 99.0))
+
+
+def test_clipped_auto_levels_sample_large_frames_on_a_grid(widget, monkeypatch):
+    stim_widget, _stim = widget
+    monkeypatch.setattr(dmd_stim_widget, "_LEVELS_SAMPLE_SIZE", 100)
+    image = np.random.default_rng(5).random((40, 40))
+    stim_widget._set_image(image)
+
+    stim_widget._apply_auto_levels_clipped()
+    sampled = image[::4, ::4]
+    assert stim_widget._current_levels == pytest.approx(
+        (np.percentile(sampled, 1.0), np.percentile(sampled, 99.0))
+    )
+
+    stim_widget._apply_histogram_levels((1.0, 99.0), precise=True)
+    assert stim_widget._current_levels == pytest.approx(
+        (np.percentile(image, 1.0), np.percentile(image, 99.0))
+    )
+
+
+@pytest.mark.parametrize("angle", [0.0, np.pi / 2.0, 0.7])
+def test_default_axis_conversions_match_explicit_arguments(widget, angle):
+    stim_widget, _stim = widget
+    origin = np.array([6.0, 2.0])
+    stim_widget._set_axis_state(origin, angle, True)
+    points = np.array([[1.0, 2.0], [-3.0, 4.5]])
+
+    np.testing.assert_allclose(
+        stim_widget._camera_to_axis(points),
+        stim_widget._camera_to_axis(points, origin=origin, angle=angle),
+    )
+    np.testing.assert_allclose(
+        stim_widget._axis_to_camera(points[0]),
+        stim_widget._axis_to_camera(points[0], origin=origin, angle=angle),
+    )
+
+
+def test_roi_manager_bulk_update_emits_once(widget):
+    stim_widget, _stim = widget
+    manager = stim_widget.roi_manager
+    first, second = QTreeWidgetItem(), QTreeWidgetItem()
+    triangle = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    manager.register_polygon(first, triangle)
+    manager.register_polygon(second, triangle)
+    single: list[QTreeWidgetItem] = []
+    bulk: list[list[QTreeWidgetItem]] = []
+    manager.shapeEdited.connect(single.append)
+    manager.shapesBulkEdited.connect(bulk.append)
+
+    manager.update_shapes_bulk(
+        [(first, "polygon", triangle + 1.0), (second, "polygon", triangle + 2.0)]
+    )
+
+    assert single == []
+    assert bulk == [[first, second]]
+    np.testing.assert_allclose(manager.shape_points(second), triangle + 2.0)
+
+
+def test_polygon_cell_edit_updates_roi_without_rebuilding_table(widget):
+    stim_widget, _stim = widget
+    item = QTreeWidgetItem(["polygon"])
+    triangle = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    stim_widget.roi_manager.register_polygon(item, triangle)
+    stim_widget._set_roi_properties_item(item)
+    table = stim_widget.ui.tableWidget_polygon_points
+    untouched = table.item(0, 0)
+
+    table.item(1, 1).setText("4.5")
+
+    expected = triangle.copy()
+    expected[1, 1] = 4.5
+    np.testing.assert_allclose(stim_widget.roi_manager.shape_points(item), expected)
+    assert table.item(0, 0) is untouched
+    assert table.item(1, 1).text() == "4.500000"
+
+
+def test_rectangle_spin_edits_are_coalesced(widget):
+    stim_widget, _stim = widget
+    item = QTreeWidgetItem(["rectangle"])
+    square = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0]])
+    stim_widget.roi_manager.register_rectangle(item, square)
+    stim_widget._set_roi_properties_item(item)
+    edited: list[QTreeWidgetItem] = []
+    stim_widget.roi_manager.shapeEdited.connect(edited.append)
+
+    stim_widget.ui.doubleSpinBox_rect_width.setValue(6.0)
+    stim_widget.ui.doubleSpinBox_rect_width.setValue(8.0)
+    assert edited == []
+    assert stim_widget._rect_edit_timer.isActive()
+
+    # Switching the properties panel applies the pending edit first.
+    stim_widget._set_roi_properties_item(None)
+
+    assert not stim_widget._rect_edit_timer.isActive()
+    points = stim_widget.roi_manager.shape_points(item)
+    assert np.ptp(points[:, 0]) == pytest.approx(8.0)
+    assert np.ptp(points[:, 1]) == pytest.approx(4.0)
+    assert edited
+
+
+def test_rectangle_spin_edit_does_not_repopulate_the_spin_boxes(widget, monkeypatch):
+    stim_widget, _stim = widget
+    item = QTreeWidgetItem(["rectangle"])
+    square = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0]])
+    stim_widget.roi_manager.register_rectangle(item, square)
+    stim_widget._set_roi_properties_item(item)
+    populated: list[object] = []
+    original_populate = stim_widget._populate_rectangle_properties
+
+    def counting_populate(shape):
+        populated.append(shape)
+        original_populate(shape)
+
+    monkeypatch.setattr(
+        stim_widget, "_populate_rectangle_properties", counting_populate
+    )
+
+    stim_widget.ui.doubleSpinBox_rect_height.setValue(6.0)
+    stim_widget._commit_rectangle_edit()
+
+    assert populated == []
+    shape = stim_widget.roi_manager.get_shape(item)
+    assert stim_widget._roi_properties_sig == stim_widget._rectangle_properties_sig(
+        shape
+    )
+    stim_widget._rect_edit_timer.stop()
+
+
+def test_image_transform_maps_camera_pixels_into_axis_frame(widget):
+    from PySide6.QtCore import QPointF
+
+    stim_widget, _stim = widget
+    stim_widget._set_axis_state(np.array([10.0, 5.0]), 0.6, True)
+    for camera in (np.array([0.0, 0.0]), np.array([13.0, -2.0])):
+        mapped = stim_widget._image_item.transform().map(QPointF(*camera))
+        np.testing.assert_allclose(
+            [mapped.x(), mapped.y()], stim_widget._camera_to_axis(camera), atol=1e-9
+        )
+
+    stim_widget._set_axis_state(np.array([0.0, 0.0]), 0.0, False)
+    assert stim_widget._image_item.transform().isIdentity()
+
+
+def test_grid_preview_overlay_accepts_batched_corners(widget):
+    stim_widget, _stim = widget
+    params = dmd_stim_widget.GridParameters(rows=2, columns=3, angle_deg=30.0)
+    overlay = stim_widget._ensure_grid_preview_overlay()
+
+    overlay.set_rectangles(params.rectangle_corners())
+    batched_x, batched_y = overlay._curve.getData()
+    batched_connect = overlay._curve.opts["connect"].copy()
+    overlay.set_rectangles(params.rectangle_points())
+    listed_x, listed_y = overlay._curve.getData()
+
+    np.testing.assert_allclose(batched_x, listed_x)
+    np.testing.assert_allclose(batched_y, listed_y)
+    np.testing.assert_array_equal(batched_connect, overlay._curve.opts["connect"])
+
+
+def test_axis_feedback_banner_is_built_on_first_show(widget):
+    stim_widget, _stim = widget
+    assert stim_widget._axis_feedback_frame is None
+    stim_widget._hide_axis_feedback_banner()
+
+    cache = dmd_stim_widget._AxisRedefinitionCache(
+        previous_origin=np.zeros(2),
+        previous_angle=0.0,
+        new_origin=np.zeros(2),
+        new_angle=0.0,
+        shapes={QTreeWidgetItem(): (np.zeros((3, 2)), "polygon")},
+        behaviour=stim_widget._AXIS_MODE_MOVE,
+    )
+    stim_widget._show_axis_feedback_banner(cache)
+
+    frame = stim_widget._axis_feedback_frame
+    assert frame is not None and not frame.isHidden()
+    assert not stim_widget._axis_feedback_move_button.isEnabled()
+    stim_widget._hide_axis_feedback_banner()
+    assert frame.isHidden()
+
+
+def test_axis_micrometre_scale_is_reused_until_calibration_changes(
+    widget, monkeypatch
+):
+    stim_widget, _stim = widget
+    calls: list[float] = []
+
+    def fake_scale(axis, calibration):
+        calls.append(axis.angle_rad)
+        return np.array([2.0, 4.0])
+
+    monkeypatch.setattr(dmd_stim_widget, "axis_micrometre_scale", fake_scale)
+    stim_widget._calibration = object()
+    stim_widget._micro_scale_key = None
+
+    assert stim_widget._axis_micrometre_scale() == (2.0, 4.0)
+    np.testing.assert_allclose(
+        stim_widget._axis_pixels_to_micrometres(np.array([[1.0, 1.0]])), [[2.0, 4.0]]
+    )
+    np.testing.assert_allclose(
+        stim_widget._micrometres_to_axis_pixels(np.array([2.0, 4.0])), [1.0, 1.0]
+    )
+    assert len(calls) == 1
+
+    stim_widget._set_axis_state(np.zeros(2), 0.5, True)
+    stim_widget._axis_micrometre_scale()
+    assert calls == [0.0, 0.5]
+    stim_widget._calibration = None
+
+
+def test_set_image_displays_row_major_frames_without_transpose(widget):
+    stim_widget, _stim = widget
+    image = np.arange(12, dtype=np.uint16).reshape(3, 4)
+
+    stim_widget._set_image(image, apply_axis=False)
+
+    item = stim_widget._image_item
+    assert item.axisOrder == "row-major"
+    assert item.autoDownsample
+    assert item.image.shape == (3, 4)
+    assert (item.width(), item.height()) == (4, 3)
+
+
+@pytest.mark.parametrize("suffix", [".tif", ".png"])
+def test_read_image_file_decodes_tiff_and_other_formats(tmp_path, suffix):
+    from PIL import Image
+
+    image = np.arange(20, dtype=np.uint8).reshape(4, 5) * 10
+    path = tmp_path / f"frame{suffix}"
+    Image.fromarray(image).save(path)
+
+    decoded = dmd_stim_widget._read_image_file(path)
+
+    np.testing.assert_array_equal(decoded, image)
+
+
+def test_read_image_file_returns_first_page_of_multi_page_tiff(tmp_path):
+    tifffile = pytest.importorskip("tifffile")
+    stack = np.arange(2 * 5 * 6, dtype=np.uint16).reshape(2, 5, 6)
+    path = tmp_path / "stack.tif"
+    tifffile.imwrite(path, stack)
+
+    decoded = dmd_stim_widget._read_image_file(path)
+    mapped = dmd_stim_widget._read_image_file(path, memory_map=True)
+
+    np.testing.assert_array_equal(decoded, stack[0])
+    assert not isinstance(mapped, np.memmap)
+    np.testing.assert_array_equal(mapped, stack[0])
+
+
+def test_read_image_file_memory_maps_uncompressed_tiff(tmp_path):
+    tifffile = pytest.importorskip("tifffile")
+    image = np.arange(30, dtype=np.uint16).reshape(5, 6)
+    plain = tmp_path / "plain.tif"
+    packed = tmp_path / "packed.tif"
+    tifffile.imwrite(plain, image)
+    tifffile.imwrite(packed, image, compression="zlib")
+
+    mapped = dmd_stim_widget._read_image_file(plain, memory_map=True)
+    decoded = dmd_stim_widget._read_image_file(packed, memory_map=True)
+
+    assert isinstance(mapped, np.memmap)
+    assert not isinstance(decoded, np.memmap)
+    np.testing.assert_array_equal(mapped, image)
+    np.testing.assert_array_equal(decoded, image)
+    del mapped
+
+
+def test_refresh_image_loads_most_recent_image_including_tiff(widget, tmp_path):
+    from PIL import Image
+
+    stim_widget, _stim = widget
+    older = tmp_path / "older.png"
+    newer = tmp_path / "newer.TIFF"
+    Image.fromarray(np.zeros((2, 3), dtype=np.uint8)).save(older)
+    Image.fromarray(np.full((4, 5), 7, dtype=np.uint8)).save(newer, format="TIFF")
+    (tmp_path / "notes.txt").write_text("ignored")
+    os.utime(older, (1_000, 1_000))
+    os.utime(newer, (2_000, 2_000))
+    stim_widget.ui.lineEdit_image_folder_path.setText(str(tmp_path))
+
+    stim_widget._refresh_image()
+
+    assert stim_widget._current_image.shape == (4, 5)
+
+
+def test_read_table_ms_tracks_table_edits(widget):
+    from PySide6.QtWidgets import QTableWidgetItem
+
+    stim_widget, _stim = widget
+    table = stim_widget.ui.tableWidget
+    table.setRowCount(3)
+    for row, values in enumerate((("0", "10", "0"), ("5", "", "1"), ("x", "1", "0"))):
+        for col, text in enumerate(values):
+            table.setItem(row, col, QTableWidgetItem(text))
+
+    assert stim_widget._read_table_ms() == ([0, 5], [10, 0], [0, 1])
+    assert stim_widget._read_table_ms() == ([0, 5], [10, 0], [0, 1])
+
+    table.blockSignals(True)
+    table.item(2, 0).setText("9")
+    table.blockSignals(False)
+    assert stim_widget._read_table_ms() == ([0, 5, 9], [10, 0, 1], [0, 1, 0])
+
+    table.removeRow(0)
+    assert stim_widget._read_table_ms() == ([5, 9], [0, 1], [1, 0])
+
+    table.setRowCount(0)
+    assert stim_widget._read_table_ms() == ([], [], [])
+
+
+def test_refresh_image_skips_unchanged_newest_file(widget, tmp_path, monkeypatch):
+    from PIL import Image
+
+    stim_widget, _stim = widget
+    path = tmp_path / "frame.png"
+    Image.fromarray(np.zeros((4, 5), dtype=np.uint8)).save(path)
+    stim_widget.ui.lineEdit_image_folder_path.setText(str(tmp_path))
+    reads: list[str] = []
+    original_read = dmd_stim_widget._read_image_file
+
+    def counting_read(file_path, **kwargs):
+        reads.append(str(file_path))
+        return original_read(file_path, **kwargs)
+
+    monkeypatch.setattr(dmd_stim_widget, "_read_image_file", counting_read)
+
+    stim_widget._refresh_image()
+    stim_widget._refresh_image()
+    assert len(reads) == 1
+
+    Image.fromarray(np.ones((4, 5), dtype=np.uint8)).save(path)
+    os.utime(path, ns=(path.stat().st_mtime_ns + 10**9,) * 2)
+    stim_widget._refresh_image()
+    assert len(reads) == 2
+
+    stim_widget._set_image(np.zeros((2, 2), dtype=np.uint8), apply_axis=False)
+    stim_widget._refresh_image()
+    assert len(reads) == 3
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+def test_percentile_level_matches_numpy_lower_rank(dtype):
+    values = np.random.default_rng(3).integers(0, 250, 5_001).astype(dtype)
+
+    # Integer frames use nearest-rank levels; floats keep np.percentile.
+    method = "linear" if values.dtype.kind == "f" else "lower"
+    for percentile in (0.0, 1.0, 37.5, 99.0, 100.0):
+        expected = np.percentile(values, percentile, method=method)
+        assert dmd_stim_widget._percentile_level(values, percentile) == expected
+
+
+def test_set_image_keeps_native_frame_and_displays_native_dtypes(widget):
+    stim_widget, _stim = widget
+    frame = np.arange(48, dtype=np.uint16).reshape(6, 8)
+
+    stim_widget._set_image(frame[:, ::2], apply_axis=False)
+    assert stim_widget._current_image.flags.c_contiguous
+    assert stim_widget._current_image.dtype == np.uint16
+    np.testing.assert_array_equal(stim_widget._current_image, frame[:, ::2])
+
+    wide = frame.astype(np.int64) + (1 << 40)
+    stim_widget._set_image(wide, apply_axis=False)
+    assert stim_widget._current_image is wide
+    assert stim_widget._image_item.image.dtype == np.float32
+
+    stim_widget._set_image(frame, apply_axis=False)
+    assert stim_widget._current_image is frame
+
+
+def test_last_calibration_location_is_checked_once_per_path(
+    widget, tmp_path, monkeypatch
+):
+    stim_widget, _stim = widget
+    saved = tmp_path / "calibration.h5"
+    saved.write_bytes(b"")
+    checked: list[str] = []
+    original_exists = dmd_stim_widget.Path.exists
+
+    def counting_exists(path, *args, **kwargs):
+        checked.append(str(path))
+        return original_exists(path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        stim_widget._preferences, "set_last_calibration_file_path", lambda path: None
+    )
+    monkeypatch.setattr(dmd_stim_widget.Path, "exists", counting_exists)
+    stim_widget.remember_calibration_file(str(saved))
+
+    assert stim_widget._last_calibration_file_location() == (saved, True, True)
+    assert stim_widget._last_calibration_file_location() == (saved, True, True)
+    assert checked == [str(saved)]
+
+    missing = tmp_path / "missing" / "other.h5"
+    stim_widget.remember_calibration_file(str(missing))
+    assert stim_widget._last_calibration_file_location() == (missing, False, False)
+
+
+def test_write_table_ms_fills_cells_and_descriptions(widget):
+    from datetime import timedelta
+
+    stim_widget, _stim = widget
+    tree_manager = stim_widget.tree_manager
+    for desc in ("left", "right"):
+        tree_manager.add_pattern()
+        item = stim_widget.ui.treeWidget.topLevelItem(
+            stim_widget.ui.treeWidget.topLevelItemCount() - 1
+        )
+        tree_manager.set_pattern_label(
+            item, stim_widget.ui.treeWidget.indexOfTopLevelItem(item), desc
+        )
+    model = PatternSequence(
+        patterns=[],
+        sequence=[1, 0, 1],
+        timings=[timedelta(milliseconds=ms) for ms in (0, 250, 500)],
+        durations=[timedelta(milliseconds=ms) for ms in (100, 100, 50)],
+        descriptions=[],
+    )
+
+    stim_widget._write_table_ms(model)
+
+    table = stim_widget.ui.tableWidget
+    cells = [
+        [table.item(r, c).text() for c in range(4)] for r in range(table.rowCount())
+    ]
+    assert cells == [
+        ["0", "100", "1", "right"],
+        ["250", "100", "0", "left"],
+        ["500", "50", "1", "right"],
+    ]
+    assert not table.item(0, 3).flags() & Qt.ItemFlag.ItemIsEditable
+    assert stim_widget._read_table_ms() == ([0, 250, 500], [100, 100, 50], [1, 0, 1])
+
+
+def test_restore_after_calibration_reloads_spilled_frame(widget):
+    stim_widget, _stim = widget
+    frame = np.arange(24, dtype=np.uint16).reshape(4, 6)
+    path = dmd_stim_widget._spill_image(frame)
+    assert path is not None and os.path.exists(path)
+
+    stim_widget._restore_after_calibration(path, None, None)
+
+    np.testing.assert_array_equal(stim_widget._current_image, frame)
+    assert not os.path.exists(path)
+
+
+def test_same_geometry_frames_leave_the_view_range_alone(widget, monkeypatch):
+    stim_widget, _stim = widget
+    view_box = stim_widget._get_view_box()
+    stim_widget._set_image(np.zeros((6, 8), dtype=np.uint8), fit_to_view=True)
+    calls: list[object] = []
+    original_set_range = view_box.setRange
+
+    def counting_set_range(*args, **kwargs):
+        calls.append(kwargs)
+        return original_set_range(*args, **kwargs)
+
+    monkeypatch.setattr(view_box, "setRange", counting_set_range)
+
+    stim_widget._set_image(np.ones((6, 8), dtype=np.uint8))
+    stim_widget._set_image(np.ones((6, 8), dtype=np.uint8), fit_to_view=True)
+    assert calls == []
+
+    stim_widget._set_image(np.ones((12, 8), dtype=np.uint8))
+    assert len(calls) == 1
+
+
+def test_gpu_display_falls_back_to_host_frames(widget, monkeypatch):
+    stim_widget, _stim = widget
+    frame = np.zeros((4, 4), dtype=np.uint16)
+    assert stim_widget._display_array(frame) is frame
+
+    class _UnavailableCupy:
+        @staticmethod
+        def asarray(_image):
+            raise RuntimeError("no CUDA device")
+
+    monkeypatch.setattr(dmd_stim_widget, "cupy", _UnavailableCupy)
+    monkeypatch.setattr(stim_widget, "_gpu_display", True)
+
+    stim_widget._set_image(frame, apply_axis=False)
+
+    assert isinstance(stim_widget._image_item.image, np.ndarray)
+    assert not stim_widget._gpu_display
+
+
+def test_update_ui_draws_at_most_one_frame_per_redraw_interval(widget, monkeypatch):
+    stim_widget, _stim = widget
+    monkeypatch.setattr(stim_widget, "dmd", object())
+    drawn: list[int] = []
+
+    def record_frame(frame, **_kwargs):
+        drawn.append(int(frame[0, 0]))
+
+    monkeypatch.setattr(stim_widget, "_set_image", record_frame)
+    frames = [np.full((2, 2), value, dtype=np.uint8) for value in range(4)]
+
+    for frame in frames:
+        stim_widget.update_ui(frame)
+    assert drawn == [0]
+
+    stim_widget._redraw_timer.stop()
+    stim_widget._draw_pending_frame()
+    assert drawn == [0, 3]
+    assert stim_widget._redraw_timer.isActive()
+
+    stim_widget._redraw_timer.stop()
+    stim_widget._draw_pending_frame()
+    assert drawn == [0, 3]
+
+
+def test_same_size_frames_keep_axis_overlay(widget, monkeypatch):
+    stim_widget, _stim = widget
+    stim_widget._set_axis_state(np.array([2.0, 1.0]), 0.3, True)
+    stim_widget._set_image(np.zeros((6, 8), dtype=np.uint8))
+    redraws: list[object] = []
+    monkeypatch.setattr(
+        stim_widget._axis_line_item, "setData", lambda *args: redraws.append(args)
+    )
+
+    stim_widget._set_image(np.ones((6, 8), dtype=np.uint8))
+    assert redraws == []
+    assert stim_widget._axis_line_item.isVisible()
+
+    stim_widget._set_image(np.ones((12, 8), dtype=np.uint8))
+    assert len(redraws) == 1
+
+    stim_widget._set_image(np.ones((12, 8), dtype=np.uint8), apply_axis=False)
+    assert not stim_widget._axis_line_item.isVisible()
+    stim_widget._set_image(np.ones((12, 8), dtype=np.uint8))
+    assert len(redraws) == 2
+    assert stim_widget._axis_line_item.isVisible()
+
+
+def test_run_controls_skip_unchanged_state(widget, monkeypatch):
+    stim_widget, stim = widget
+    stim_widget.calibration = object()
+    stim_widget._set_axis_state([0.0, 0.0], 0.0, True)
+    stim_widget._toggle_dmd_connection()
+    button = stim_widget.ui.pushButton_run_now
+    assert button.isEnabled()
+
+    calls: list[str] = []
+    monkeypatch.setattr(button, "setStyleSheet", calls.append)
+    stim_widget._on_run_state_check()
+    stim_widget._on_run_state_check()
+    assert calls == []
+
+    stim._running = True
+    stim_widget._on_run_state_check()
+    assert len(calls) == 1
+    assert button.text() == "Stop run now"
+
+
+def test_rectangle_shape_points_and_recentre(widget):
+    rotated = np.array(
+        [[0.0, 0.0], [2.0 * np.sqrt(3.0), 2.0], [2.0 * np.sqrt(3.0) - 1.0, 2.0 + np.sqrt(3.0)], [-1.0, np.sqrt(3.0)]]
+    )
+    shape = RectangleShape(rotated, QTreeWidgetItem(["rect"]))
+    np.testing.assert_allclose(shape.get_points(), rotated, atol=1e-9)
+
+    shape.change_ref(QPointF(10.0, -5.0), 0.0)
+    moved = shape.get_points()
+    np.testing.assert_allclose(moved.mean(axis=0), (10.0, -5.0), atol=1e-9)
+    np.testing.assert_allclose(moved - moved[0], rotated - rotated[0], atol=1e-9)
+
+
+def test_grid_dialog_accept_adds_one_pattern_per_cell(widget, monkeypatch):
+    stim_widget, _stim = widget
+    params = dmd_stim_widget.GridParameters(rows=2, columns=3)
+    stim_widget._grid_dialog = SimpleNamespace(parameters=lambda: params)
+    renumbers: list[int] = []
+    original = stim_widget.tree_manager.renumber_pattern_labels
+
+    def _counting_renumber():
+        renumbers.append(1)
+        original()
+
+    monkeypatch.setattr(
+        stim_widget.tree_manager, "renumber_pattern_labels", _counting_renumber
+    )
+
+    stim_widget._on_grid_dialog_accepted()
+
+    tree = stim_widget.ui.treeWidget
+    assert tree.topLevelItemCount() == 6
+    assert len(renumbers) == 1
+    assert tree.topLevelItem(0).text(0) == "#0 Grid 2x3 (1/6)"
+    assert tree.topLevelItem(5).text(0) == "#5 Grid 2x3 (6/6)"
+    corners = params.rectangle_corners()
+    for index, (pattern_item, shapes) in enumerate(
+        stim_widget.tree_manager.pattern_structure()
+    ):
+        assert pattern_item.isExpanded()
+        assert [shape.text(0) for shape in shapes] == ["rectangle"]
+        np.testing.assert_allclose(
+            stim_widget.roi_manager.get_shape(shapes[0]).get_points(),
+            corners[index],
+            atol=1e-9,
+        )
+    assert tree.currentItem() is tree.topLevelItem(5).child(0)
+
+
+def test_finite_values_only_copies_when_needed():
+    values = np.linspace(0.0, 1.0, 8)
+    assert dmd_stim_widget._finite_values(values) is values
+    values[3] = np.inf
+    values[5] = np.nan
+    assert dmd_stim_widget._finite_values(values).size == 6
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.float32])
+def test_full_auto_levels_use_frame_extremes(widget, dtype):
+    stim_widget, _stim = widget
+    image = np.arange(20, 20 + 32 * 32, dtype=dtype).reshape(32, 32)
+    expected_lower = 20.0
+    if image.dtype.kind == "f":
+        image[0, 0] = np.nan
+        expected_lower = 21.0
+    stim_widget._set_image(image)
+
+    stim_widget._apply_auto_levels_full()
+
+    assert stim_widget._current_levels == (expected_lower, 1043.0)
+
+
+def test_fit_view_reuses_ranges_for_unchanged_geometry(widget, monkeypatch):
+    stim_widget, _stim = widget
+    stim_widget._set_axis_state([10.0, 20.0], 0.25, True)
+    stim_widget._set_image(np.zeros((40, 60), dtype=np.uint8), fit_to_view=True)
+    first = stim_widget._fit_view_cache
+
+    def _unexpected():
+        raise AssertionError("bounds recomputed")
+
+    monkeypatch.setattr(stim_widget, "_image_axis_bounds", _unexpected)
+    stim_widget._fit_view_to_image()
+    assert stim_widget._fit_view_cache == first
+
+    monkeypatch.undo()
+    stim_widget._set_axis_state([10.0, 20.0], 0.5, True)
+    stim_widget._fit_view_to_image()
+    assert stim_widget._fit_view_cache != first
+
+
+def test_draw_polygon_converts_captured_vertices(widget, monkeypatch):
+    stim_widget, _stim = widget
+    vertices = [QPointF(1.0, 2.0), QPointF(5.0, 2.5), QPointF(3.0, 7.0)]
+    monkeypatch.setattr(
+        dmd_stim_widget.PolygonDrawingCapture, "exec", lambda self: list(vertices)
+    )
+    stim_widget.tree_manager.add_pattern()
+
+    stim_widget._draw_polygon_roi()
+
+    node = stim_widget.ui.treeWidget.topLevelItem(0).child(0)
+    np.testing.assert_allclose(
+        stim_widget.roi_manager.shape_points(node),
+        [[1.0, 2.0], [5.0, 2.5], [3.0, 7.0]],
+    )
+
+
+def test_auto_levels_reused_until_a_new_frame_is_shown(widget, monkeypatch):
+    stim_widget, _stim = widget
+    image = np.arange(64 * 64, dtype=np.uint16).reshape(64, 64)
+    stim_widget._set_image(image)
+    stim_widget._apply_auto_levels_clipped()
+    clipped = stim_widget._current_levels
+    calls: list[tuple] = []
+    compute = stim_widget._compute_histogram_levels
+
+    def _counting(*args, **kwargs):
+        calls.append(args)
+        return compute(*args, **kwargs)
+
+    monkeypatch.setattr(stim_widget, "_compute_histogram_levels", _counting)
+
+    stim_widget._apply_auto_levels_full()
+    stim_widget._apply_auto_levels_clipped()
+    assert stim_widget._current_levels == clipped
+    assert len(calls) == 1
+
+    stim_widget._set_image(image + 10)
+    stim_widget._apply_auto_levels_clipped()
+    assert len(calls) == 2
+    assert stim_widget._current_levels != clipped
+
+
+def test_model_export_survives_point_pool_compaction(widget):
+    stim_widget, _stim = widget
+    stim_widget.calibration = DMDCalibration(
+        camera_origin_pixels=(0.0, 0.0),
+        camera_pixels_per_mirror=(1.5, 1.25),
+        camera_rotation_rad=0.0,
+        micrometers_per_mirror=(2.0, 2.5),
+    )
+    # A pool with room for exactly four squares, so the two resized shapes
+    # below each force a compaction while the model getter is collecting.
+    stim_widget.roi_manager._points_pool = np.empty((16, 2))
+    square = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0]])
+    to_um = stim_widget._axis_pixels_to_micrometres
+    stim_widget.model = PatternSequence(
+        patterns=[[to_um(square + 10.0 * index)] for index in range(4)],
+        sequence=[],
+        timings=[],
+        durations=[],
+    )
+    nodes = [
+        shapes[0] for _pattern, shapes in stim_widget.tree_manager.pattern_structure()
+    ]
+    expected = [square + 10.0 * index for index in range(4)]
+    for index, count in ((0, 5), (3, 12)):
+        angles = np.linspace(0.0, 2.0 * np.pi, count, endpoint=False)
+        expected[index] = 100.0 * index + np.column_stack(
+            (np.cos(angles), np.sin(angles))
+        )
+        stim_widget.roi_manager.get_shape(nodes[index]).set_points(expected[index])
+        stim_widget.roi_manager.shapeEdited.emit(nodes[index])
+
+    model = stim_widget.model
+
+    for index, pattern in enumerate(model.patterns):
+        np.testing.assert_allclose(pattern[0], to_um(expected[index]), atol=1e-9)
+
+
+def _start_calibration(stim_widget, monkeypatch, calibration_path, diagonal):
+    monkeypatch.setattr(
+        stim_widget, "_prompt_calibration_preparation", lambda: ("load", 0)
+    )
+    monkeypatch.setattr(
+        dmd_stim_widget.QFileDialog,
+        "getOpenFileName",
+        lambda *args, **kwargs: (str(calibration_path), ""),
+    )
+    monkeypatch.setattr(stim_widget, "_prompt_calibration_diagonal", diagonal)
+    spilled: list[str | None] = []
+    spill = dmd_stim_widget._spill_image
+
+    def _recording_spill(image):
+        spilled.append(spill(image))
+        return spilled[-1]
+
+    monkeypatch.setattr(dmd_stim_widget, "_spill_image", _recording_spill)
+    monkeypatch.setattr(dmd_stim_widget, "_SPILL_IMAGE_BYTES", 16)
+    return spilled
+
+
+def test_calibration_error_restores_and_removes_spilled_frame(
+    widget, tmp_path, monkeypatch
+):
+    tifffile = pytest.importorskip("tifffile")
+    stim_widget, _stim = widget
+    calibration_path = tmp_path / "calibration.tif"
+    tifffile.imwrite(calibration_path, np.zeros((5, 6), dtype=np.uint16))
+    frame = np.arange(48, dtype=np.uint16).reshape(6, 8)
+    stim_widget._set_image(frame)
+
+    def _broken_diagonal():
+        raise RuntimeError("capture failed")
+
+    spilled = _start_calibration(
+        stim_widget, monkeypatch, calibration_path, _broken_diagonal
+    )
+    with pytest.raises(RuntimeError, match="capture failed"):
+        stim_widget._define_new_calibration()
+
+    assert len(spilled) == 1 and spilled[0] is not None
+    assert not os.path.exists(spilled[0])
+    np.testing.assert_array_equal(stim_widget._current_image, frame)
+
+
+def test_calibration_keeps_memory_mapped_frame_in_place(
+    widget, tmp_path, monkeypatch
+):
+    tifffile = pytest.importorskip("tifffile")
+    stim_widget, _stim = widget
+    frame_path = tmp_path / "frame.tif"
+    calibration_path = tmp_path / "calibration.tif"
+    tifffile.imwrite(frame_path, np.arange(48, dtype=np.uint16).reshape(6, 8))
+    tifffile.imwrite(calibration_path, np.zeros((5, 6), dtype=np.uint16))
+    stim_widget._set_image(
+        dmd_stim_widget._read_image_file(frame_path, memory_map=True)
+    )
+    assert stim_widget._current_image_mapped
+
+    spilled = _start_calibration(
+        stim_widget, monkeypatch, calibration_path, lambda: None
+    )
+    monkeypatch.setattr(
+        dmd_stim_widget.QMessageBox, "information", lambda *args: None
+    )
+    stim_widget._define_new_calibration()
+
+    assert spilled == []
+    assert stim_widget._current_image.shape == (6, 8)
+
+
+@pytest.mark.parametrize(
+    "shape_points",
+    [np.zeros((2, 5)), np.arange(7.0)],
+    ids=["transposed", "odd-flat"],
+)
+def test_model_setter_rejects_malformed_shapes(widget, shape_points):
+    from datetime import timedelta
+
+    stim_widget, _stim = widget
+    stim_widget.calibration = DMDCalibration(
+        camera_origin_pixels=(0.0, 0.0),
+        camera_pixels_per_mirror=(1.5, 1.25),
+        camera_rotation_rad=0.0,
+        micrometers_per_mirror=(2.0, 2.5),
+    )
+    square = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0]])
+    stim_widget.model = PatternSequence(
+        patterns=[[square]],
+        sequence=[0],
+        timings=[timedelta(milliseconds=0)],
+        durations=[timedelta(milliseconds=100)],
+    )
+
+    with pytest.raises(ValueError, match=r"\(N, 2\)"):
+        stim_widget.model = PatternSequence(
+            patterns=[[shape_points]], sequence=[], timings=[], durations=[]
+        )
+
+    assert stim_widget.ui.treeWidget.topLevelItemCount() == 1
+    assert stim_widget.ui.tableWidget.rowCount() == 1
+    model = stim_widget.model
+    assert model.sequence == [0]
+    np.testing.assert_allclose(model.patterns[0][0], square, atol=1e-9)
+
+
+# The stand-in cupy module makes pyqtgraph warn that the real one is missing.
+@pytest.mark.filterwarnings("ignore:cupy library could not be loaded")
+def test_gpu_display_option_is_restored_when_disabled_or_closed(widget, monkeypatch):
+    from PySide6.QtGui import QCloseEvent
+
+    stim_widget, _stim = widget
+    saved: list[bool] = []
+    monkeypatch.setattr(
+        dmd_stim_widget, "cupy", SimpleNamespace(asarray=lambda image: image)
+    )
+    monkeypatch.setattr(
+        stim_widget._preferences, "set_gpu_display_enabled", saved.append
+    )
+    stim_widget._set_image(np.zeros((4, 4), dtype=np.uint16))
+    pg = dmd_stim_widget.pg
+
+    stim_widget._on_gpu_display_toggled(True)
+    assert stim_widget._gpu_display
+    assert pg.getConfigOption("useCupy") is True
+
+    stim_widget._on_gpu_display_toggled(False)
+    assert pg.getConfigOption("useCupy") is False
+    assert saved == [True, False]
+
+    stim_widget._on_gpu_display_toggled(True)
+    stim_widget.closeEvent(QCloseEvent())
+    assert not stim_widget._gpu_display
+    assert pg.getConfigOption("useCupy") is False